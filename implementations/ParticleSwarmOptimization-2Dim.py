@@ -1,10 +1,10 @@
-import math
-import random
-from typing import Tuple, List
+from typing import Dict, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+from pso import PSO, Checkpointer, Seed, Trajectory, TrajectoryRecorder, Verbosity, fitness_surface
+
 # Constants
 VELOCITY_BOUNDS: Tuple[float, float] = (0, 1) # R_1 & R_2
 INERTIA: float = 1                      # w
@@ -17,124 +17,57 @@ BOUNDS: Tuple[float, float] = (-5, 5)
 COGNITIVE_COEFFICIENT: float = 1      # C_1
 SOCIAL_COEFFICIENT: float = 0.5         # C_2
 
+HISTORY_STRIDE: int = 1                 # Record every n-th iteration
+HISTORY_WINDOW: int | None = None       # Keep only the last n records
+RECORD_DIRECTORY: str | None = None     # Stream every iteration to chunked .npy files
+VERBOSITY: Verbosity = Verbosity.FULL   # SILENT, SUMMARY or FULL per-particle dump
+SEED: int | None = None                 # Fixed seed for reproducible runs
+CHECKPOINT_PATH: str | None = None      # Periodic checkpoint, resume with `python -m pso.checkpoint`
+CHECKPOINT_INTERVAL: int = 100
+SURFACE_RESOLUTION: int = 50            # Contour grid, cached on disk per function, bounds & resolution
+
 def fitness_function(x: float, y: float) -> float:
     return np.cos(2 * x + y) + np.pow(x - y, 2) - 5 * x + 3 * y + 2
 
-# Implementation
-class Particle:
-    def __init__(self, pos: List[float], fitness_value: float, velocity: List[float]):
-        self._pos: List[float] = pos
-        self.pos_history: List[List[float]] = [pos]
-
-        self._fitness_value: float = fitness_value
-        self.fitness_value_history: List[float] = [fitness_value]
-
-        self.velocity = velocity
-        self.best_pos = pos.copy()
-
-
-    @property
-    def pos(self):
-        return self._pos
-
-    @pos.setter
-    def pos(self, value):
-        self._pos = value
-        self.pos_history.append(value)
-
-    @property
-    def fitness_value(self):
-        return self._fitness_value
-
-    @fitness_value.setter
-    def fitness_value(self, value):
-        self._fitness_value = value
-        self.fitness_value_history.append(value)
-
-class Swarm:
-    def __init__(self, population):
-        self.particles: List[Particle] = []
-        self.best_pos: List[float] | None = None                  # G_best
-        self.best_fitness_value: float = math.inf
-
-        # Generate particles
-        for i in range(population):
-            pos = [round(random.uniform(*BOUNDS), 5), round(random.uniform(*BOUNDS), 5)]
-
-            particle = Particle(
-                pos = pos,
-                fitness_value = fitness_function(pos[0], pos[1]),
-                velocity = [0, 0]
-            )
-
-            self.particles.append(particle)
-
-            if (self.best_pos is None) or (particle.fitness_value < self.best_fitness_value):
-                self.best_pos = particle.pos.copy()
-                self.best_fitness_value = particle.fitness_value
-
-class PSO:
-    def __init__(self):
-        self.swarm = Swarm(SWARM_POPULATION)
-
-    def run(self) -> None:
-        for iteration in range(MAX_ITERATIONS):
-            print("--- Iterasi {} ---".format(iteration + 1))
-
-            for (i, particle) in enumerate(self.swarm.particles):
-                for dim in range(DIMENSION):
-                    particle.velocity[dim] = (
-                        INERTIA * particle.velocity[dim] +
-                        COGNITIVE_COEFFICIENT * round(random.uniform(*VELOCITY_BOUNDS), 5) * (particle.best_pos[dim] - particle.pos[dim]) +
-                        SOCIAL_COEFFICIENT * round(random.uniform(*VELOCITY_BOUNDS), 5) * (self.swarm.best_pos[dim] - particle.pos[dim])
-                    )
-
-                    particle.pos[dim] = max(BOUNDS[0], min(particle.pos[dim] + particle.velocity[dim], BOUNDS[1])) # Make sure particle stays inside given dimension's boundaries
-
-                particle.fitness_value = fitness_function(particle.pos[0], particle.pos[1])
-
-                if particle.fitness_value < fitness_function(particle.best_pos[0], particle.best_pos[1]):
-                    particle.best_pos = particle.pos.copy()
-
-                    if particle.fitness_value < self.swarm.best_fitness_value:
-                        self.swarm.best_pos = particle.pos.copy()
-                        self.swarm.best_fitness_value = particle.fitness_value
-
-                print("Particle {}".format(i + 1))
-                print(
-                    "      x: {}, y: {}, fitness: {}, velocity_x: {}, velocity_y: {}, p_best_x: {}, p_best_y: {}"
-                    .format(round(particle.pos[0], 4), round(particle.pos[1], 4), round(particle.fitness_value, 4), round(particle.velocity[0], 4), round(particle.velocity[1], 4), round(particle.best_pos[0], 4), round(particle.best_pos[1], 4))
-                )
-
-            print("G_best -> x: {}, y: {}".format(round(self.swarm.best_pos[0], 4), round(self.swarm.best_pos[1], 4)))
-            print("")
-
-        print("G_best -> x: {}, y: {}".format(round(self.swarm.best_pos[0], 4), round(self.swarm.best_pos[1], 4)))
-        print("Best Fitness: {}".format(round(self.swarm.best_fitness_value, 4)))
+def create_pso(seed: Seed = SEED, state: Dict[str, np.ndarray] | None = None) -> PSO:
+    return PSO(
+        fitness_function,
+        BOUNDS,
+        dimension=DIMENSION,
+        population=SWARM_POPULATION,
+        max_iterations=MAX_ITERATIONS,
+        inertia=INERTIA,
+        cognitive_coefficient=COGNITIVE_COEFFICIENT,
+        social_coefficient=SOCIAL_COEFFICIENT,
+        velocity_bounds=VELOCITY_BOUNDS,
+        history_stride=HISTORY_STRIDE,
+        history_window=HISTORY_WINDOW,
+        recorder=TrajectoryRecorder(RECORD_DIRECTORY) if RECORD_DIRECTORY else None,
+        verbosity=VERBOSITY,
+        seed=seed,
+        checkpointer=Checkpointer(CHECKPOINT_PATH, CHECKPOINT_INTERVAL) if CHECKPOINT_PATH else None,
+        state=state,
+    )
 
 if __name__ == "__main__":
-    pso = PSO()
+    pso = create_pso()
     pso.run()
 
     # Contour
-    x = np.linspace(*BOUNDS, 50)
-    y = np.linspace(*BOUNDS, 50)
-    X, Y = np.meshgrid(x, y)
+    surface = fitness_surface(fitness_function, BOUNDS, SURFACE_RESOLUTION)
     fig = plt.figure("Particle Swarm Optimization")
 
     ax = fig.add_subplot(1, 1, 1)
-    ac = ax.contourf(X, Y, fitness_function(X, Y), cmap='viridis')
+    ac = ax.contourf(surface.x, surface.y, surface.z, cmap='viridis')
     fig.colorbar(ac)
 
     # Scatter
-    x_pos_history = []
-    y_pos_history = []
-
-    for particle in pso.swarm.particles:
-        for pos in particle.pos_history:
-            x_pos_history.append(pos[0])
-            y_pos_history.append(pos[1])
+    history = Trajectory(RECORD_DIRECTORY) if RECORD_DIRECTORY else pso.swarm.history
+    pos_history = history.pos
+    plt.scatter(pos_history[..., 0].ravel(), pos_history[..., 1].ravel(), c='r')
 
-    plt.scatter(x_pos_history, y_pos_history, c='r')
+    plt.show()
 
-    plt.show()
\ No newline at end of file
+    # with tempconfig({ 'output_file': 'swarm.mp4' }):
+    #     swarm_animation = PSOSwarmAnimation(pos_history, BOUNDS, surface)
+    #     swarm_animation.render()
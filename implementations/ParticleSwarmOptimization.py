@@ -1,9 +1,11 @@
 import math
-import random
-from typing import Tuple, List
+from typing import Dict, Tuple
 
+import numpy as np
 from matplotlib import pyplot as plt
 
+from pso import PSO, Checkpointer, Seed, Trajectory, TrajectoryRecorder, Verbosity
+
 
 # Hyperparameters
 VELOCITY_BOUNDS: Tuple[float, float] = (0, 1) # R_1 & R_2
@@ -15,111 +17,46 @@ BOUNDS: Tuple[float, float] = (0, 5)
 COGNITIVE_COEFFICIENT: float = 0.5      # C_1
 SOCIAL_COEFFICIENT: float = 1         # C_2
 
+HISTORY_STRIDE: int = 1                 # Record every n-th iteration
+HISTORY_WINDOW: int | None = None       # Keep only the last n records
+RECORD_DIRECTORY: str | None = None     # Stream every iteration to chunked .npy files
+VERBOSITY: Verbosity = Verbosity.FULL   # SILENT, SUMMARY or FULL per-particle dump
+SEED: int | None = None                 # Fixed seed for reproducible runs
+CHECKPOINT_PATH: str | None = None      # Periodic checkpoint, resume with `python -m pso.checkpoint`
+CHECKPOINT_INTERVAL: int = 100
+
 def fitness_function(x: float) -> float:
     return math.pow((7 * x - 3), 2) + math.exp((1 / 2) * math.pow(x, 2))
 
-# Implementation
-class Particle:
-    def __init__(self, pos: float, fitness_value: float, velocity: float):
-        self._pos: float = pos
-        self.pos_history: List[float] = [pos]
-
-        self._fitness_value: float = fitness_value
-        self.fitness_value_history: List[float] = [fitness_value]
-
-        self.velocity: float = velocity
-        self.best_pos: float = pos
-
-    @property
-    def pos(self):
-        return self._pos
-
-    @pos.setter
-    def pos(self, value):
-        self._pos = value
-        self.pos_history.append(value)
-
-    @property
-    def fitness_value(self):
-        return self._fitness_value
-
-    @fitness_value.setter
-    def fitness_value(self, value):
-        self._fitness_value = value
-        self.fitness_value_history.append(value)
-
-
-class Swarm:
-    def __init__(self, population):
-        self.particles: List[Particle] = []
-        self.best_pos: float | None = None                  # G_best
-        self.best_fitness_value: float = math.inf
-
-        # Generate particles
-        for i in range(population):
-            pos = round(random.uniform(*BOUNDS), 5)
-
-            particle = Particle(
-                pos = pos,
-                fitness_value = fitness_function(pos),
-                velocity = 0
-            )
-
-            self.particles.append(particle)
-
-            if (self.best_pos is None) or (particle.fitness_value < self.best_fitness_value):
-                self.best_pos = particle.pos
-                self.best_fitness_value = particle.fitness_value
-
-class PSO:
-    def __init__(self):
-        self.swarm = Swarm(SWARM_POPULATION)
-
-    def run(self):
-        for iteration in range(MAX_ITERATIONS):
-            print("--- Iterasi {} ---".format(iteration + 1))
-
-            for (i, particle) in enumerate(self.swarm.particles):
-                particle.velocity = (
-                        INERTIA * particle.velocity +
-                        COGNITIVE_COEFFICIENT * round(random.uniform(*VELOCITY_BOUNDS), 5) * (
-                                    particle.best_pos - particle.pos) +
-                        SOCIAL_COEFFICIENT * round(random.uniform(*VELOCITY_BOUNDS), 5) * (
-                                    self.swarm.best_pos - particle.pos)
-                )
-
-                particle.pos = max(BOUNDS[0], min(particle.pos + particle.velocity, BOUNDS[1]))  # Make sure particle stays inside given boundaries
-
-                particle.fitness_value = fitness_function(particle.pos)
-
-                if particle.fitness_value < fitness_function(particle.best_pos):
-                    particle.best_pos = particle.pos
-
-                    if particle.fitness_value < self.swarm.best_fitness_value:
-                        self.swarm.best_pos = particle.pos
-                        self.swarm.best_fitness_value = particle.fitness_value
-
-                print("Particle {}".format(i + 1))
-                print(
-                    "      x: {}, fitness: {}, velocity: {}, p_best: {}"
-                    .format(round(particle.pos, 4), round(particle.fitness_value, 4), round(particle.velocity, 4), round(particle.best_pos, 4))
-                )
-
-            print("G_best: {}".format(round(self.swarm.best_pos, 4)))
-            print("")
-
-        print("G_best: {}".format(round(self.swarm.best_pos, 4)))
-        print("Best Fitness: {}".format(round(self.swarm.best_fitness_value, 4)))
+def create_pso(seed: Seed = SEED, state: Dict[str, np.ndarray] | None = None) -> PSO:
+    return PSO(
+        fitness_function,
+        BOUNDS,
+        dimension=1,
+        population=SWARM_POPULATION,
+        max_iterations=MAX_ITERATIONS,
+        inertia=INERTIA,
+        cognitive_coefficient=COGNITIVE_COEFFICIENT,
+        social_coefficient=SOCIAL_COEFFICIENT,
+        velocity_bounds=VELOCITY_BOUNDS,
+        history_stride=HISTORY_STRIDE,
+        history_window=HISTORY_WINDOW,
+        recorder=TrajectoryRecorder(RECORD_DIRECTORY) if RECORD_DIRECTORY else None,
+        verbosity=VERBOSITY,
+        seed=seed,
+        checkpointer=Checkpointer(CHECKPOINT_PATH, CHECKPOINT_INTERVAL) if CHECKPOINT_PATH else None,
+        state=state,
+    )
 
 if __name__ == '__main__':
-    pso = PSO()
+    pso = create_pso()
     pso.run()
 
     fig, (pos_plot, fitness_plot) = plt.subplots(2)
 
-    for particle in pso.swarm.particles:
-        pos_plot.plot(particle.pos_history, '-o')
-        fitness_plot.plot(particle.fitness_value_history, '-o')
+    history = Trajectory(RECORD_DIRECTORY) if RECORD_DIRECTORY else pso.swarm.history
+    pos_plot.plot(history.iterations, history.pos[..., 0], '-o')
+    fitness_plot.plot(history.iterations, history.fitness_value[:], '-o')
 
     pos_plot.set_ylabel('x')
     pos_plot.set_xlabel('Iterasi')
@@ -133,8 +70,8 @@ if __name__ == '__main__':
     plt.show()
 
     # with tempconfig({ 'output_file': 'a.png' }):
-    #     pos_plot = PSOPosPlot(pso, MAX_ITERATIONS, BOUNDS)
+    #     pos_plot = PSOPosPlot(history, MAX_ITERATIONS, BOUNDS)
     #     pos_plot.render()
     #
-    # fitness_plot = PSOFitnessPlot(pso, MAX_ITERATIONS)
-    # fitness_plot.render()
\ No newline at end of file
+    # fitness_plot = PSOFitnessPlot(history, MAX_ITERATIONS)
+    # fitness_plot.render()
@@ -0,0 +1,11 @@
+from .engine import PSO, Particle, Swarm, Bounds, Seed, as_bounds
+from .fitness import BatchFitnessFunction, batch_fitness, as_batch_fitness
+from .history import TrajectoryHistory
+from .recorder import TrajectoryRecorder, Trajectory
+from .stopping import StoppingCriterion, NoImprovement, SwarmDiameter, WallClock, EvaluationBudget
+from .reporting import Reporter, Verbosity
+from .evaluation import Evaluator, EvaluationStats
+from .neighbourhoods import Neighbourhood, NEIGHBOURHOODS
+from .surface import Surface, fitness_surface
+from .checkpoint import Checkpointer, resume
+from .hooks import Hook, Metrics
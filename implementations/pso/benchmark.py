@@ -0,0 +1,126 @@
+import argparse
+import itertools
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .engine import PSO
+from .functions import FUNCTIONS, estimate_optimum
+from .reporting import Verbosity
+
+
+def run_case(
+        name: str,
+        population: int,
+        dimension: int,
+        iterations: int,
+        seed: int,
+        optimum: float,
+        engine_options: Dict[str, Any],
+        measure_memory: bool = True,
+) -> Dict[str, Any]:
+    benchmark = FUNCTIONS[name]
+
+    def create_pso() -> PSO:
+        return PSO(
+            benchmark.function,
+            benchmark.bounds,
+            dimension=dimension,
+            population=population,
+            max_iterations=iterations,
+            verbosity=Verbosity.SILENT,
+            seed=seed,
+            **engine_options,
+        )
+
+    start = time.perf_counter()
+    pso = create_pso()
+    pso.run()
+    wall_time = time.perf_counter() - start
+
+    # tracemalloc slows small runs down several times over, so memory comes from a second, identical run.
+    # Stateful engine options such as an Evaluator cache are shared with it and may lower its peak.
+    peak_memory = None
+    if measure_memory:
+        tracemalloc.start()
+        create_pso().run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        'function': name,
+        'population': population,
+        'dimension': dimension,
+        'iterations': pso.iteration,
+        'seed': seed,
+        'wall_time': wall_time,
+        'evaluations': pso.evaluations,
+        'evaluations_per_second': pso.evaluations / wall_time,
+        'peak_memory': peak_memory,
+        'best_fitness_value': pso.swarm.best_fitness_value,
+        'final_error': pso.swarm.best_fitness_value - optimum,
+        'engine_options': {key: repr(value) for key, value in engine_options.items()},
+    }
+
+def run_benchmarks(
+        functions: Sequence[str] = tuple(FUNCTIONS),
+        populations: Sequence[int] = (10, 100, 1000),
+        dimensions: Sequence[int] = (2, 10, 50),
+        iterations: Sequence[int] = (100,),
+        repeats: int = 1,
+        seed: int = 0,
+        engine_options: Dict[str, Any] | None = None,
+        measure_memory: bool = True,
+) -> List[Dict[str, Any]]:
+    # Functions with a fixed dimension count ignore the dimension sweep
+    results = []
+
+    for name in functions:
+        benchmark = FUNCTIONS[name]
+        optimum = benchmark.optimum if benchmark.optimum is not None else estimate_optimum(benchmark)
+        case_dimensions = dimensions if benchmark.dimension is None else (benchmark.dimension,)
+
+        for population, dimension, iteration_count, repeat in itertools.product(populations, case_dimensions, iterations, range(repeats)):
+            results.append(run_case(name, population, dimension, iteration_count, seed + repeat, optimum, engine_options or {}, measure_memory))
+
+    return results
+
+def write_results(path: str, results: List[Dict[str, Any]]) -> None:
+    with open(path, 'w') as file:
+        json.dump({
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'results': results,
+        }, file, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark PSO speed and quality over standard test functions")
+    parser.add_argument('--functions', nargs='+', default=list(FUNCTIONS), choices=list(FUNCTIONS))
+    parser.add_argument('--populations', nargs='+', type=int, default=[10, 100, 1000])
+    parser.add_argument('--dimensions', nargs='+', type=int, default=[2, 10, 50])
+    parser.add_argument('--iterations', nargs='+', type=int, default=[100])
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--no-memory', action='store_true', help="skip the separate traced run that measures peak memory")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.functions, args.populations, args.dimensions, args.iterations, args.repeats, args.seed, measure_memory=not args.no_memory)
+    write_results(args.output, results)
+
+    for result in results:
+        print(
+            "{function} n={population} d={dimension} iterations={iterations}: {wall_time:.4f}s, {evaluations_per_second:.0f} evaluations/s, "
+            "{memory}error {final_error:.6g}".format(
+                memory='peak {} B, '.format(result['peak_memory']) if result['peak_memory'] is not None else '',
+                **result,
+            )
+        )
@@ -0,0 +1,130 @@
+import argparse
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .engine import PSO, Seed, Swarm
+
+
+SWARM_FIELDS = ('pos', 'velocity', 'fitness_value', 'particle_best_pos', 'particle_best_fitness_value', 'best_pos')
+
+def snapshot(pso: 'PSO') -> Dict[str, np.ndarray]:
+    # Copies everything the next iteration depends on, so the caller can keep running while it is written.
+    # History contributes only the records written so far, oldest first.
+    swarm = pso.swarm
+    state = {field: getattr(swarm, field).copy() for field in SWARM_FIELDS}
+    state.update(
+        best_fitness_value=np.array(swarm.best_fitness_value),
+        history_pos=np.array(swarm.history.pos),
+        history_fitness_value=np.array(swarm.history.fitness_value),
+        history_iterations=np.array(swarm.history.iterations),
+        history_count=np.array(swarm.history.count),
+        recorder_count=np.array(pso.recorder.count if pso.recorder is not None else -1),
+        neighbours=pso.neighbours if pso.neighbours is not None else np.zeros((0, 0), dtype=int),
+        convergence=pso.convergence.copy(),
+        iteration=np.array(pso.iteration),
+        evaluations=np.array(pso.evaluations),
+        rng_state=np.array(json.dumps(pso.rng.bit_generator.state)),
+    )
+    return state
+
+def restore_swarm(swarm: 'Swarm', state: Dict[str, np.ndarray]) -> None:
+    for field in SWARM_FIELDS:
+        setattr(swarm, field, state[field].copy())
+
+    swarm.best_fitness_value = float(state['best_fitness_value'])
+    swarm.history.restore(
+        int(state['history_count']),
+        state['history_pos'],
+        state['history_fitness_value'],
+        state['history_iterations'],
+    )
+
+def restore(pso: 'PSO', state: Dict[str, np.ndarray]) -> None:
+    # The swarm itself is restored by Swarm, before anything would be evaluated
+    pso.convergence = state['convergence'].copy()
+    pso.iteration = int(state['iteration'])
+    pso.evaluations = int(state['evaluations'])
+    pso.rng.bit_generator.state = json.loads(str(state['rng_state']))
+
+    # Random neighbourhoods were drawn from the original stream, the rebuilt one came from an unseeded Generator
+    if pso.neighbours is not None:
+        pso.neighbours = state['neighbours'].copy()
+
+    if pso.recorder is not None:
+        recorder_count = int(state['recorder_count'])
+        if recorder_count < 0:
+            raise ValueError("the checkpoint was written without a recorder, resuming would start a recording mid-run")
+
+        # Rows past the checkpoint belong to iterations that are about to run again
+        pso.recorder.reopen(recorder_count)
+
+def write_checkpoint(path: Path, state: Dict[str, np.ndarray]) -> None:
+    # Uncompressed .npz written next to the target and renamed, a crash never leaves a torn checkpoint
+    temporary = path.with_name(path.name + '.tmp')
+    with open(temporary, 'wb') as file:
+        np.savez(file, **state)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temporary, path)
+
+def load_checkpoint(path: str | os.PathLike) -> Dict[str, np.ndarray]:
+    with np.load(path, allow_pickle=False) as checkpoint:
+        return {field: checkpoint[field] for field in checkpoint.files}
+
+
+class Checkpointer:
+    # Snapshots the run every `interval` iterations and writes it from a background thread
+    def __init__(self, path: str | os.PathLike, interval: int = 100):
+        self.path = Path(path)
+        self.interval = interval
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Future | None = None
+
+    def save(self, pso: 'PSO') -> None:
+        # The recording must reach the disk up to the row the checkpoint resumes from
+        if pso.recorder is not None:
+            pso.recorder.flush()
+
+        state = snapshot(pso)
+
+        # At most one write in flight, a slow disk delays the loop instead of piling up snapshots
+        self.wait()
+        self._pending = self._executor.submit(write_checkpoint, self.path, state)
+
+    def maybe_save(self, pso: 'PSO') -> None:
+        if pso.iteration % self.interval == 0:
+            self.save(pso)
+
+    def wait(self) -> None:
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def close(self) -> None:
+        self.wait()
+
+
+def resume(create_pso: Callable[['Seed', Dict[str, np.ndarray]], 'PSO'], path: str | os.PathLike) -> 'PSO':
+    # create_pso(seed, state) must build the same configuration the checkpoint was written with and pass
+    # state on to PSO, which then continues the run without drawing or evaluating a new swarm
+    return create_pso(None, load_checkpoint(path))
+
+
+if __name__ == '__main__':
+    from .restarts import load_script
+
+    parser = argparse.ArgumentParser(description="Resume a PSO run from its last checkpoint")
+    parser.add_argument('script', help="script defining create_pso(seed, state), e.g. ParticleSwarmOptimization-2Dim.py")
+    parser.add_argument('checkpoint')
+    args = parser.parse_args()
+
+    pso = resume(load_script(str(Path(args.script).resolve())).create_pso, args.checkpoint)
+    pso.run()
@@ -0,0 +1,307 @@
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .checkpoint import Checkpointer, restore, restore_swarm
+from .fitness import BatchFitnessFunction, as_batch_fitness
+from .history import TrajectoryHistory
+from .hooks import Hook
+from .neighbourhoods import NEIGHBOURHOODS, Neighbourhood
+from .recorder import TrajectoryRecorder
+from .reporting import Reporter, Verbosity
+from .stopping import StoppingCriterion
+
+
+Bounds = Tuple[float, float] | Sequence[Tuple[float, float]]
+
+def as_bounds(bounds: Bounds, dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    # A single (low, high) pair is shared by every dimension
+    bounds = np.broadcast_to(np.asarray(bounds, dtype=float), (dimension, 2))
+    return bounds[:, 0].copy(), bounds[:, 1].copy()
+
+Seed = int | np.random.SeedSequence | None
+
+
+class Particle:
+    # View over a single row of the swarm's arrays, 1-D swarms expose plain floats
+    def __init__(self, swarm: 'Swarm', index: int):
+        self.swarm = swarm
+        self.index = index
+
+    def _row(self, array: np.ndarray) -> float | np.ndarray:
+        return float(array[self.index, 0]) if self.swarm.dimension == 1 else array[self.index]
+
+    @property
+    def pos(self) -> float | np.ndarray:
+        return self._row(self.swarm.pos)
+
+    @property
+    def velocity(self) -> float | np.ndarray:
+        return self._row(self.swarm.velocity)
+
+    @property
+    def best_pos(self) -> float | np.ndarray:
+        return self._row(self.swarm.particle_best_pos)
+
+    @property
+    def best_fitness_value(self) -> float:
+        return float(self.swarm.particle_best_fitness_value[self.index])
+
+    @property
+    def fitness_value(self) -> float:
+        return float(self.swarm.fitness_value[self.index])
+
+    @property
+    def pos_history(self) -> np.ndarray:
+        pos_history = self.swarm.history.pos[:, self.index]
+        return pos_history[:, 0] if self.swarm.dimension == 1 else pos_history
+
+    @property
+    def fitness_value_history(self) -> np.ndarray:
+        return self.swarm.history.fitness_value[:, self.index]
+
+
+class Swarm:
+    def __init__(
+            self,
+            population: int,
+            lower_bounds: np.ndarray,
+            upper_bounds: np.ndarray,
+            fitness: BatchFitnessFunction,
+            history: TrajectoryHistory,
+            rng: np.random.Generator,
+            state: Dict[str, np.ndarray] | None = None,
+    ):
+        self.dimension = len(lower_bounds)
+        self.history = history
+        self.improved: np.ndarray = np.zeros(population, dtype=bool)                # P_best changed this iteration
+
+        if state is not None:
+            # Continues a checkpointed run, nothing is drawn or evaluated
+            restore_swarm(self, state)
+        else:
+            # Structure of arrays, shape (population, dimension)
+            self.pos: np.ndarray = np.round(rng.uniform(lower_bounds, upper_bounds, (population, self.dimension)), 5)
+            self.velocity: np.ndarray = np.zeros((population, self.dimension))
+            self.fitness_value: np.ndarray = fitness(self.pos)
+            self.particle_best_pos: np.ndarray = self.pos.copy()                        # P_best
+            self.particle_best_fitness_value: np.ndarray = self.fitness_value.copy()    # f(P_best)
+
+            self.history.record(0, self.pos, self.fitness_value)
+
+            best = int(np.argmin(self.fitness_value))
+            self.best_pos: np.ndarray = self.pos[best].copy()          # G_best
+            self.best_fitness_value: float = float(self.fitness_value[best])
+
+        self.particles: List[Particle] = [Particle(self, i) for i in range(population)]
+
+    def local_best_pos(self, neighbours: np.ndarray) -> np.ndarray:
+        # One gather and one argmin over the (particles, k) neighbour index, no loop over neighbours
+        best = np.argmin(self.particle_best_fitness_value[neighbours], axis=1)
+        return self.particle_best_pos[neighbours[np.arange(len(neighbours)), best]]
+
+    def emigrants(self, count: int) -> np.ndarray:
+        # Indices of the particles with the best personal best
+        return np.argpartition(self.particle_best_fitness_value, count - 1)[:count]
+
+    def immigrate(self, pos: np.ndarray, fitness_value: np.ndarray) -> None:
+        # Incoming particles replace the ones with the worst personal best
+        worst = np.argpartition(self.particle_best_fitness_value, -len(pos))[-len(pos):]
+
+        self.pos[worst] = pos
+        self.velocity[worst] = 0
+        self.fitness_value[worst] = fitness_value
+        self.particle_best_pos[worst] = pos
+        self.particle_best_fitness_value[worst] = fitness_value
+
+        best = int(np.argmin(fitness_value))
+        if fitness_value[best] < self.best_fitness_value:
+            self.best_pos = pos[best].copy()
+            self.best_fitness_value = float(fitness_value[best])
+
+
+class PSO:
+    def __init__(
+            self,
+            fitness_function: Callable,
+            bounds: Bounds,
+            dimension: int | None = None,
+            population: int = 10,
+            max_iterations: int = 3,
+            inertia: float = 1,
+            cognitive_coefficient: float = 0.5,
+            social_coefficient: float = 1,
+            velocity_bounds: Tuple[float, float] = (0, 1),
+            history_stride: int = 1,
+            history_window: int | None = None,
+            recorder: TrajectoryRecorder | None = None,
+            stopping_criteria: Sequence[StoppingCriterion] = (),
+            verbosity: Verbosity = Verbosity.SUMMARY,
+            neighbourhood: str | Neighbourhood | None = None,
+            seed: Seed = None,
+            checkpointer: Checkpointer | None = None,
+            hooks: Sequence[Hook] = (),
+            state: Dict[str, np.ndarray] | None = None,
+    ):
+        # state is a loaded checkpoint to continue from, see `pso.checkpoint.resume`
+        if dimension is None:
+            dimension = 1 if np.ndim(bounds) == 1 else len(bounds)
+
+        self.lower_bounds, self.upper_bounds = as_bounds(bounds, dimension)
+        self.max_iterations = max_iterations                # n
+        self.inertia = inertia                              # w
+        self.cognitive_coefficient = cognitive_coefficient  # C_1
+        self.social_coefficient = social_coefficient        # C_2
+        self.velocity_bounds = velocity_bounds              # R_1 & R_2
+
+        # Every random draw of this run comes from one stream, parallel runs use spawned child seeds
+        self.rng = np.random.default_rng(seed)
+
+        self.fitness: BatchFitnessFunction = as_batch_fitness(fitness_function)
+        self.swarm = Swarm(
+            population,
+            self.lower_bounds,
+            self.upper_bounds,
+            self.fitness,
+            TrajectoryHistory(max_iterations, population, dimension, stride=history_stride, window=history_window),
+            self.rng,
+            state,
+        )
+
+        # G_best fitness after each iteration, index 0 is the initial swarm
+        self.convergence: np.ndarray = np.full(max_iterations + 1, self.swarm.best_fitness_value)
+
+        self.iteration = 0                                  # Completed iterations
+        self.evaluations = population
+        self.stopping_criteria = list(stopping_criteria)
+        self.stopped_by: str | None = None
+
+        self.reporter: Reporter | None = Reporter(verbosity) if verbosity != Verbosity.SILENT else None
+
+        # None follows G_best, otherwise each particle follows the best P_best in its neighbourhood
+        if isinstance(neighbourhood, str):
+            neighbourhood = NEIGHBOURHOODS[neighbourhood]
+        self.neighbours: np.ndarray | None = neighbourhood(population, self.rng) if neighbourhood is not None else None
+
+        self.checkpointer = checkpointer
+        self.hooks: List[Hook] = list(hooks)
+
+        # The starting swarm is recorded by the first step, until then the recording can still be moved
+        self.recorder = recorder
+        if state is not None:
+            restore(self, state)
+
+    def _hook(self, event: str, phase: str) -> None:
+        for hook in self.hooks:
+            getattr(hook, event)(phase, self)
+
+    def step(self, iteration: int) -> None:
+        swarm = self.swarm
+        hooks = self.hooks
+
+        if hooks:
+            for hook in hooks:
+                hook.iteration_start(self)
+
+        if self.recorder is not None and self.recorder.count == 0:
+            self.recorder.record(self.iteration, swarm)
+
+        if hooks:
+            self._hook('before', 'update')
+
+        # R_1 & R_2 for every particle and dimension in a single draw
+        r = self.rng.uniform(*self.velocity_bounds, (*swarm.pos.shape, 2))
+        social_best_pos = swarm.best_pos if self.neighbours is None else swarm.local_best_pos(self.neighbours)
+
+        swarm.velocity = (
+            self.inertia * swarm.velocity +
+            self.cognitive_coefficient * r[..., 0] * (swarm.particle_best_pos - swarm.pos) +
+            self.social_coefficient * r[..., 1] * (social_best_pos - swarm.pos)
+        )
+
+        if hooks:
+            self._hook('after', 'update')
+            self._hook('before', 'clamp')
+
+        swarm.pos = np.clip(swarm.pos + swarm.velocity, self.lower_bounds, self.upper_bounds) # Make sure particles stay inside every dimension's boundaries
+
+        if hooks:
+            self._hook('after', 'clamp')
+            self._hook('before', 'evaluate')
+
+        swarm.fitness_value = self.fitness(swarm.pos)
+        self.evaluations += len(swarm.fitness_value)
+
+        if hooks:
+            self._hook('after', 'evaluate')
+            self._hook('before', 'best')
+
+        swarm.improved = swarm.fitness_value < swarm.particle_best_fitness_value
+        swarm.particle_best_pos = np.where(swarm.improved[:, None], swarm.pos, swarm.particle_best_pos)
+        swarm.particle_best_fitness_value = np.where(swarm.improved, swarm.fitness_value, swarm.particle_best_fitness_value)
+
+        # G_best is updated once per iteration from the whole swarm
+        best = int(np.argmin(swarm.fitness_value))
+        if swarm.fitness_value[best] < swarm.best_fitness_value:
+            swarm.best_pos = swarm.pos[best].copy()
+            swarm.best_fitness_value = float(swarm.fitness_value[best])
+
+        if hooks:
+            self._hook('after', 'best')
+
+        swarm.history.record(iteration + 1, swarm.pos, swarm.fitness_value)
+        self.convergence[iteration + 1] = swarm.best_fitness_value
+        self.iteration = iteration + 1
+
+        if self.recorder is not None:
+            self.recorder.record(iteration + 1, swarm)
+
+        if self.reporter is not None:
+            self.reporter.iteration(iteration + 1, swarm)
+
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save(self)
+
+        if hooks:
+            for hook in hooks:
+                hook.iteration_end(self)
+
+    def separate_outputs(self, name: str) -> None:
+        # Parallel runs built by one create_pso would share its checkpoint file and recording directory,
+        # each run writes to its own instead: run.npz -> run.<name>.npz and <directory>/<name>/
+        if self.checkpointer is not None:
+            path = self.checkpointer.path
+            self.checkpointer.path = path.with_name('{}.{}{}'.format(path.stem, name, path.suffix))
+
+        if self.recorder is not None:
+            self.recorder.move_to(self.recorder.directory / name)
+
+    @property
+    def evaluations_saved(self) -> int:
+        return (self.max_iterations - self.iteration) * len(self.swarm.particles)
+
+    def run(self) -> None:
+        for criterion in self.stopping_criteria:
+            criterion.start(self)
+
+        # Starts from a restored iteration counter when resuming from a checkpoint
+        for iteration in range(self.iteration, self.max_iterations):
+            self.step(iteration)
+
+            self.stopped_by = next((criterion.name for criterion in self.stopping_criteria if criterion.should_stop(self)), None)
+            if self.stopped_by is not None:
+                break
+
+        if self.stopped_by is not None:
+            self.convergence = self.convergence[:self.iteration + 1]
+            self.swarm.history.finish(self.iteration, self.swarm.pos, self.swarm.fitness_value)
+
+        if self.recorder is not None:
+            self.recorder.close()
+
+        if self.checkpointer is not None:
+            self.checkpointer.save(self)
+            self.checkpointer.close()
+
+        if self.reporter is not None:
+            self.reporter.finish(self)
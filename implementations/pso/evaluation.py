@@ -0,0 +1,150 @@
+import asyncio
+import functools
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+
+BACKENDS = ('serial', 'thread', 'process', 'asyncio')
+
+
+class EvaluationStats:
+    def __init__(self):
+        self.requested = 0          # Positions asked for
+        self.duplicates = 0         # Repeated inside the same batch
+        self.cache_hits = 0         # Served from the LRU cache
+        self.computed = 0           # Actually sent to the objective
+        self.queue_time = 0.0       # Total time computed positions waited for a worker
+        self.max_queue_time = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.duplicates + self.cache_hits) / self.requested if self.requested else 0.0
+
+    @property
+    def mean_queue_time(self) -> float:
+        return self.queue_time / self.computed if self.computed else 0.0
+
+    def summary(self) -> str:
+        return (
+            "evaluations: {}, computed: {}, duplicates: {}, cache hits: {}, hit rate: {}, mean queue: {}s, max queue: {}s"
+            .format(self.requested, self.computed, self.duplicates, self.cache_hits, round(self.hit_rate, 4),
+                    round(self.mean_queue_time, 6), round(self.max_queue_time, 6))
+        )
+
+
+def timed_call(function: Callable, submitted_at: float, pos: np.ndarray) -> Tuple[float, float]:
+    # time.time() so the queue time is comparable across processes
+    queued = time.time() - submitted_at
+    return function(*pos), queued
+
+
+class Evaluator:
+    # Batched fitness function that sends every unseen position of an iteration to a worker pool.
+    # Positions are quantized to `decimals` digits, duplicates inside a batch are evaluated once
+    # and up to `cache_size` results are kept in an LRU cache across iterations.
+    def __init__(
+            self,
+            function: Callable,
+            backend: str = 'thread',
+            workers: int | None = None,
+            cache_size: int = 4096,
+            decimals: int = 5,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError("backend must be one of {}, got {!r}".format(BACKENDS, backend))
+
+        self.function = function        # Scalar f(*pos), a coroutine function for the asyncio backend
+        self.backend = backend
+        self.workers = workers or os.cpu_count()
+        self.cache_size = cache_size
+        self.decimals = decimals
+        self.is_batched = True
+
+        self.stats = EvaluationStats()
+        self._cache: OrderedDict[bytes, float] = OrderedDict()
+        self._executor: Executor | None = None
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            executor = ThreadPoolExecutor if self.backend == 'thread' else ProcessPoolExecutor
+            self._executor = executor(max_workers=self.workers)
+
+        return self._executor
+
+    async def _gather(self, rows: np.ndarray) -> List[Tuple[float, float]]:
+        semaphore = asyncio.Semaphore(self.workers)
+        submitted_at = time.time()
+
+        async def evaluate(pos: np.ndarray) -> Tuple[float, float]:
+            async with semaphore:
+                queued = time.time() - submitted_at
+                return await self.function(*pos), queued
+
+        return await asyncio.gather(*(evaluate(pos) for pos in rows))
+
+    def _evaluate(self, rows: np.ndarray) -> np.ndarray:
+        if self.backend == 'serial':
+            results = [(self.function(*pos), 0.0) for pos in rows]
+        elif self.backend == 'asyncio':
+            results = asyncio.run(self._gather(rows))
+        else:
+            results = list(self._pool().map(
+                functools.partial(timed_call, self.function, time.time()),
+                rows,
+                chunksize=max(1, len(rows) // (self.workers * 4)) if self.backend == 'process' else 1,
+            ))
+
+        values, queue_times = np.array(results, dtype=float).reshape(-1, 2).T
+
+        self.stats.computed += len(rows)
+        self.stats.queue_time += float(queue_times.sum())
+        self.stats.max_queue_time = max(self.stats.max_queue_time, float(queue_times.max(initial=0)))
+
+        return values
+
+    def __call__(self, population: np.ndarray) -> np.ndarray:
+        self.stats.requested += len(population)
+
+        quantized = np.round(population, self.decimals)
+        unique, first, inverse = np.unique(quantized, axis=0, return_index=True, return_inverse=True)
+        self.stats.duplicates += len(population) - len(unique)
+
+        values = np.empty(len(unique))
+        missing: List[int] = []
+
+        for i, pos in enumerate(unique):
+            key = pos.tobytes()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                values[i] = self._cache[key]
+                self.stats.cache_hits += 1
+            else:
+                missing.append(i)
+
+        if missing:
+            values[missing] = self._evaluate(population[first[missing]])
+
+            if self.cache_size > 0:
+                for i in missing:
+                    self._cache[unique[i].tobytes()] = values[i]
+
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return values[inverse.reshape(-1)]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'Evaluator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
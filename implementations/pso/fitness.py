@@ -0,0 +1,22 @@
+from typing import Callable
+
+import numpy as np
+
+
+BatchFitnessFunction = Callable[[np.ndarray], np.ndarray]
+
+def batch_fitness(function: BatchFitnessFunction) -> BatchFitnessFunction:
+    # Marks a function that already maps a (particles, dims) matrix to a fitness vector
+    function.is_batched = True
+    return function
+
+def as_batch_fitness(function: Callable) -> BatchFitnessFunction:
+    # Scalar functions such as f(x) or f(x, y) get one coordinate per argument
+    if getattr(function, 'is_batched', False):
+        return function
+
+    @batch_fitness
+    def evaluate(population: np.ndarray) -> np.ndarray:
+        return np.fromiter((function(*pos) for pos in population), dtype=float, count=len(population))
+
+    return evaluate
@@ -0,0 +1,63 @@
+import math
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+from .fitness import BatchFitnessFunction, batch_fitness
+
+
+# Standard test functions, all batched over a (particles, dims) population
+@batch_fitness
+def sphere(population: np.ndarray) -> np.ndarray:
+    return np.sum(population ** 2, axis=1)
+
+@batch_fitness
+def rastrigin(population: np.ndarray) -> np.ndarray:
+    return 10 * population.shape[1] + np.sum(population ** 2 - 10 * np.cos(2 * np.pi * population), axis=1)
+
+@batch_fitness
+def rosenbrock(population: np.ndarray) -> np.ndarray:
+    x, next_x = population[:, :-1], population[:, 1:]
+    return np.sum(100 * (next_x - x ** 2) ** 2 + (1 - x) ** 2, axis=1)
+
+@batch_fitness
+def ackley(population: np.ndarray) -> np.ndarray:
+    dimension = population.shape[1]
+    return (
+        -20 * np.exp(-0.2 * np.sqrt(np.sum(population ** 2, axis=1) / dimension))
+        - np.exp(np.sum(np.cos(2 * np.pi * population), axis=1) / dimension)
+        + 20 + math.e
+    )
+
+# Batched versions of the fitness_function in ParticleSwarmOptimization.py and ParticleSwarmOptimization-2Dim.py
+@batch_fitness
+def playground_1d(population: np.ndarray) -> np.ndarray:
+    x = population[:, 0]
+    return (7 * x - 3) ** 2 + np.exp((1 / 2) * x ** 2)
+
+@batch_fitness
+def playground_2d(population: np.ndarray) -> np.ndarray:
+    x, y = population[:, 0], population[:, 1]
+    return np.cos(2 * x + y) + (x - y) ** 2 - 5 * x + 3 * y + 2
+
+
+class BenchmarkFunction(NamedTuple):
+    function: BatchFitnessFunction
+    bounds: Tuple[float, float]
+    dimension: int | None           # None if the function works for any dimension count
+    optimum: float | None           # None if it has to be estimated on a grid
+
+FUNCTIONS: Dict[str, BenchmarkFunction] = {
+    'sphere': BenchmarkFunction(sphere, (-5.12, 5.12), None, 0.0),
+    'rastrigin': BenchmarkFunction(rastrigin, (-5.12, 5.12), None, 0.0),
+    'rosenbrock': BenchmarkFunction(rosenbrock, (-5, 10), None, 0.0),
+    'ackley': BenchmarkFunction(ackley, (-32.768, 32.768), None, 0.0),
+    'playground_1d': BenchmarkFunction(playground_1d, (0, 5), 1, None),
+    'playground_2d': BenchmarkFunction(playground_2d, (-5, 5), 2, None),
+}
+
+def estimate_optimum(benchmark: BenchmarkFunction, points: int = 4_000_000) -> float:
+    # Dense grid minimum, only meant for the low-dimensional playground functions
+    axis = np.linspace(*benchmark.bounds, round(points ** (1 / benchmark.dimension)))
+    grid = np.stack(np.meshgrid(*[axis] * benchmark.dimension), axis=-1).reshape(-1, benchmark.dimension)
+    return float(benchmark.function(grid).min())
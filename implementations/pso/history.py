@@ -0,0 +1,57 @@
+import numpy as np
+
+
+class TrajectoryHistory:
+    # Preallocated per-swarm buffers of shape (records, particles, dims), written every `stride` iterations.
+    # With `window` set, it becomes a ring buffer that only keeps the last `window` records.
+    def __init__(self, iterations: int, population: int, dimension: int, stride: int = 1, window: int | None = None):
+        self.last_iteration = iterations
+        self.stride = stride
+        self.capacity = window if window is not None else iterations // stride + 1 + (iterations % stride != 0)
+        self.count = 0
+
+        self._pos: np.ndarray = np.empty((self.capacity, population, dimension))
+        self._fitness_value: np.ndarray = np.empty((self.capacity, population))
+        self._iterations: np.ndarray = np.empty(self.capacity, dtype=int)
+
+    def record(self, iteration: int, pos: np.ndarray, fitness_value: np.ndarray, force: bool = False) -> None:
+        if iteration % self.stride != 0 and iteration != self.last_iteration and not force:
+            return
+
+        slot = self.count % self.capacity
+        self._pos[slot] = pos
+        self._fitness_value[slot] = fitness_value
+        self._iterations[slot] = iteration
+        self.count += 1
+
+    def finish(self, iteration: int, pos: np.ndarray, fitness_value: np.ndarray) -> None:
+        # Makes sure a run that stopped early still ends with its final state
+        if self.count == 0 or self._iterations[(self.count - 1) % self.capacity] != iteration:
+            self.record(iteration, pos, fitness_value, force=True)
+
+    def restore(self, count: int, pos: np.ndarray, fitness_value: np.ndarray, iterations: np.ndarray) -> None:
+        # Inverse of the ordered properties, the last len(pos) of `count` records go back to their ring slots
+        slots = (count - len(pos) + np.arange(len(pos))) % self.capacity
+        self._pos[slots] = pos
+        self._fitness_value[slots] = fitness_value
+        self._iterations[slots] = iterations
+        self.count = count
+
+    def _ordered(self, buffer: np.ndarray) -> np.ndarray:
+        if self.count <= self.capacity:
+            return buffer[:self.count]
+
+        start = self.count % self.capacity
+        return np.concatenate((buffer[start:], buffer[:start]))
+
+    @property
+    def pos(self) -> np.ndarray:
+        return self._ordered(self._pos)
+
+    @property
+    def fitness_value(self) -> np.ndarray:
+        return self._ordered(self._fitness_value)
+
+    @property
+    def iterations(self) -> np.ndarray:
+        return self._ordered(self._iterations)
@@ -0,0 +1,92 @@
+import csv
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Dict, List
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .engine import PSO
+
+
+PHASES = ('update', 'clamp', 'evaluate', 'best')
+
+
+class Hook:
+    # Called around every phase of PSO.step, a PSO without hooks skips all of this
+    def iteration_start(self, pso: 'PSO') -> None:
+        pass
+
+    def before(self, phase: str, pso: 'PSO') -> None:
+        pass
+
+    def after(self, phase: str, pso: 'PSO') -> None:
+        pass
+
+    def iteration_end(self, pso: 'PSO') -> None:
+        pass
+
+
+class Metrics(Hook):
+    COLUMNS = (
+        'iteration',
+        *('{}_time'.format(phase) for phase in PHASES),
+        'iteration_time',
+        'evaluations_per_second',
+        'improvements',
+        'best_fitness_value',
+        'diversity',
+    )
+
+    # iteration_time covers the whole step including history, recording, reporting and checkpoints,
+    # evaluations_per_second is NaN when the evaluate phase was too short to time and null in JSON
+    def __init__(self):
+        self.rows: List[tuple] = []
+        self._iteration_started = 0.0
+        self._started: Dict[str, float] = {}
+        self._durations: Dict[str, float] = {}
+
+    def iteration_start(self, pso: 'PSO') -> None:
+        self._iteration_started = time.perf_counter()
+
+    def before(self, phase: str, pso: 'PSO') -> None:
+        self._started[phase] = time.perf_counter()
+
+    def after(self, phase: str, pso: 'PSO') -> None:
+        self._durations[phase] = time.perf_counter() - self._started[phase]
+
+    def iteration_end(self, pso: 'PSO') -> None:
+        iteration_time = time.perf_counter() - self._iteration_started
+        swarm = pso.swarm
+        durations = [self._durations.get(phase, 0.0) for phase in PHASES]
+        evaluate_time = self._durations.get('evaluate', 0.0)
+
+        # Mean distance to the swarm centroid
+        diversity = float(np.linalg.norm(swarm.pos - swarm.pos.mean(axis=0), axis=1).mean())
+
+        self.rows.append((
+            pso.iteration,
+            *durations,
+            iteration_time,
+            len(swarm.fitness_value) / evaluate_time if evaluate_time > 0 else float('nan'),
+            int(np.count_nonzero(swarm.improved)),
+            swarm.best_fitness_value,
+            diversity,
+        ))
+
+    def table(self) -> Dict[str, np.ndarray]:
+        columns = zip(*self.rows) if self.rows else [()] * len(self.COLUMNS)
+        return {name: np.array(column) for name, column in zip(self.COLUMNS, columns)}
+
+    def to_json(self, path: str | os.PathLike) -> None:
+        with open(path, 'w') as file:
+            # Strict JSON has no NaN or Infinity, non-finite values are written as null
+            rows = [[None if isinstance(value, float) and not np.isfinite(value) else value for value in row] for row in self.rows]
+            json.dump([dict(zip(self.COLUMNS, row)) for row in rows], file, indent=2, allow_nan=False)
+
+    def to_csv(self, path: str | os.PathLike) -> None:
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.COLUMNS)
+            writer.writerows(self.rows)
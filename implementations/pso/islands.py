@@ -0,0 +1,189 @@
+import multiprocessing
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+from multiprocessing.synchronize import Barrier
+from typing import Callable, Dict, List, NamedTuple
+
+import numpy as np
+
+from .engine import PSO, Seed
+
+
+Topology = Callable[[int, int], List[int]]
+
+def ring(island: int, islands: int) -> List[int]:
+    # Each island only hears from its left neighbour, which keeps islands diverse the longest
+    return [(island - 1) % islands]
+
+def fully_connected(island: int, islands: int) -> List[int]:
+    return [source for source in range(islands) if source != island]
+
+TOPOLOGIES: Dict[str, Topology] = {
+    'ring': ring,
+    'fully_connected': fully_connected,
+}
+
+
+class IslandResult(NamedTuple):
+    island: int
+    best_pos: np.ndarray
+    best_fitness_value: float
+    convergence: np.ndarray
+    compute_time: float         # Spent inside PSO.step
+    migration_time: float       # Spent exchanging migrants, including waiting for slower islands
+    duration: float
+
+
+class IslandSummary:
+    def __init__(self, islands: List[IslandResult], duration: float):
+        self.islands: List[IslandResult] = sorted(islands, key=lambda island: island.island)
+        self.duration = duration
+
+        self.best: IslandResult = min(self.islands, key=lambda island: island.best_fitness_value)
+
+    @property
+    def best_pos(self) -> np.ndarray:
+        return self.best.best_pos
+
+    @property
+    def best_fitness_value(self) -> float:
+        return self.best.best_fitness_value
+
+    def report(self) -> None:
+        print("--- {} islands in {}s ---".format(len(self.islands), round(self.duration, 4)))
+
+        for island in self.islands:
+            print(
+                "Island {}: fitness: {}, compute: {}s, migration: {}s"
+                .format(island.island + 1, round(island.best_fitness_value, 4), round(island.compute_time, 4), round(island.migration_time, 4))
+            )
+
+        print("G_best: {}".format(np.round(self.best_pos, 4).tolist()))
+        print("Best Fitness: {}".format(round(self.best_fitness_value, 4)))
+
+
+def run_island(
+        create_pso: Callable[[Seed], PSO],
+        island: int,
+        islands: int,
+        seed: Seed,
+        migration_interval: int,
+        migrants: int,
+        topology: Topology,
+        pos_name: str,
+        fitness_name: str,
+        barrier: Barrier,
+        results: multiprocessing.Queue,
+) -> None:
+    start = time.perf_counter()
+    compute_time = 0.0
+    migration_time = 0.0
+
+    pos_memory = shared_memory.SharedMemory(name=pos_name)
+    fitness_memory = shared_memory.SharedMemory(name=fitness_name)
+
+    pso = create_pso(seed)
+    pso.reporter = None
+    pso.separate_outputs('island_{}'.format(island))
+    swarm = pso.swarm
+
+    # Every island owns one slot of migrants, shape (islands, migrants, dims)
+    outbox_pos = np.ndarray((islands, migrants, swarm.dimension), buffer=pos_memory.buf)
+    outbox_fitness = np.ndarray((islands, migrants), buffer=fitness_memory.buf)
+    sources = topology(island, islands)
+
+    # Stopping criteria are ignored here, every island has to reach the same migration barriers
+    for iteration in range(pso.max_iterations):
+        step_start = time.perf_counter()
+        pso.step(iteration)
+        compute_time += time.perf_counter() - step_start
+
+        if (iteration + 1) % migration_interval != 0 or iteration + 1 == pso.max_iterations:
+            continue
+
+        migration_start = time.perf_counter()
+
+        emigrants = swarm.emigrants(migrants)
+        outbox_pos[island] = swarm.particle_best_pos[emigrants]
+        outbox_fitness[island] = swarm.particle_best_fitness_value[emigrants]
+        barrier.wait()
+
+        candidate_pos = outbox_pos[sources].reshape(-1, swarm.dimension)
+        candidate_fitness = outbox_fitness[sources].ravel()
+        chosen = np.argpartition(candidate_fitness, migrants - 1)[:migrants]
+        swarm.immigrate(candidate_pos[chosen].copy(), candidate_fitness[chosen].copy())
+
+        # Nobody may overwrite its slot until every island has read from it
+        barrier.wait()
+        migration_time += time.perf_counter() - migration_start
+
+    if pso.recorder is not None:
+        pso.recorder.close()
+
+    if pso.checkpointer is not None:
+        pso.checkpointer.save(pso)
+        pso.checkpointer.close()
+
+    del outbox_pos, outbox_fitness
+    pos_memory.close()
+    fitness_memory.close()
+
+    results.put(IslandResult(
+        island, swarm.best_pos, swarm.best_fitness_value, pso.convergence,
+        compute_time, migration_time, time.perf_counter() - start,
+    ))
+
+def run_islands(
+        create_pso: Callable[[Seed], PSO],
+        dimension: int,
+        islands: int | None = None,
+        migration_interval: int = 10,
+        migrants: int = 1,
+        topology: str | Topology = 'ring',
+        seed: int = 0,
+) -> IslandSummary:
+    # create_pso(seed) must be picklable and build the same configuration on every island,
+    # island i gets child i of SeedSequence(seed)
+    islands = islands or os.cpu_count()
+    seeds = np.random.SeedSequence(seed).spawn(islands)
+    topology = TOPOLOGIES[topology] if isinstance(topology, str) else topology
+
+    pos_memory = shared_memory.SharedMemory(create=True, size=islands * migrants * dimension * 8)
+    fitness_memory = shared_memory.SharedMemory(create=True, size=islands * migrants * 8)
+    barrier = multiprocessing.Barrier(islands)
+    results = multiprocessing.Queue()
+    start = time.perf_counter()
+
+    try:
+        processes = [
+            multiprocessing.Process(target=run_island, args=(
+                create_pso, island, islands, seeds[island], migration_interval, migrants, topology,
+                pos_memory.name, fitness_memory.name, barrier, results,
+            ))
+            for island in range(islands)
+        ]
+
+        for process in processes:
+            process.start()
+
+        island_results = []
+        while len(island_results) < islands:
+            try:
+                island_results.append(results.get(timeout=1))
+            except queue.Empty:
+                # A crashed island would leave the others waiting on the barrier forever
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    barrier.abort()
+                    raise RuntimeError("An island process exited before returning its result")
+
+        for process in processes:
+            process.join()
+    finally:
+        pos_memory.close()
+        pos_memory.unlink()
+        fitness_memory.close()
+        fitness_memory.unlink()
+
+    return IslandSummary(island_results, time.perf_counter() - start)
@@ -0,0 +1,40 @@
+from typing import Callable, Dict
+
+import numpy as np
+
+
+# A neighbourhood maps the population size and the run's Generator to a (particles, k) index array,
+# every row includes the particle itself. Random topologies draw from that Generator, so they follow the run's seed.
+Neighbourhood = Callable[[int, np.random.Generator], np.ndarray]
+
+def ring(population: int, rng: np.random.Generator | None = None, radius: int = 1) -> np.ndarray:
+    offsets = np.arange(-radius, radius + 1)
+    return (np.arange(population)[:, None] + offsets) % population
+
+def von_neumann(population: int, rng: np.random.Generator | None = None) -> np.ndarray:
+    # Particles sit on a wrapped rows x columns grid and see up, down, left and right
+    rows = max(divisor for divisor in range(1, int(population ** 0.5) + 1) if population % divisor == 0)
+    if rows == 1:
+        # A single row would make up and down the particle itself
+        raise ValueError("von_neumann needs a population that factors into a grid of at least two rows, got {}".format(population))
+
+    columns = population // rows
+    row, column = np.divmod(np.arange(population), columns)
+
+    return np.stack((
+        row * columns + column,
+        ((row - 1) % rows) * columns + column,
+        ((row + 1) % rows) * columns + column,
+        row * columns + (column - 1) % columns,
+        row * columns + (column + 1) % columns,
+    ), axis=1)
+
+def random_k(population: int, rng: np.random.Generator, k: int = 3) -> np.ndarray:
+    informants = rng.integers(0, population, (population, k))
+    return np.column_stack((np.arange(population), informants))
+
+NEIGHBOURHOODS: Dict[str, Neighbourhood] = {
+    'ring': ring,
+    'von_neumann': von_neumann,
+    'random_k': random_k,
+}
@@ -0,0 +1,198 @@
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .engine import Swarm
+
+
+METADATA_FILE = 'metadata.json'
+
+def chunk_path(directory: Path, field: str, chunk: int) -> Path:
+    return directory / '{}_{:05d}.npy'.format(field, chunk)
+
+def write_metadata(directory: Path, metadata: Dict) -> None:
+    # Written atomically so readers never see a half-written header
+    temporary = directory / (METADATA_FILE + '.tmp')
+    temporary.write_text(json.dumps(metadata))
+    os.replace(temporary, directory / METADATA_FILE)
+
+
+class TrajectoryRecorder:
+    # Streams every recorded iteration into chunked .npy files:
+    #   pos_00000.npy            (chunk_size, particles, dims)
+    #   velocity_00000.npy       (chunk_size, particles, dims)
+    #   fitness_value_00000.npy  (chunk_size, particles)
+    #   iteration_00000.npy      (chunk_size,)
+    def __init__(self, directory: str | os.PathLike, chunk_size: int = 256, dtype: str = 'float64'):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self.count = 0
+
+        self.metadata: Dict | None = None
+        self._chunks: Dict[str, np.memmap] = {}
+
+    def _open_chunk(self, chunk: int, mode: str = 'w+') -> None:
+        self.flush()
+        population, dimension = self.metadata['population'], self.metadata['dimension']
+        shapes = {
+            'pos': (self.chunk_size, population, dimension),
+            'velocity': (self.chunk_size, population, dimension),
+            'fitness_value': (self.chunk_size, population),
+        }
+
+        self._chunks = {
+            field: np.lib.format.open_memmap(chunk_path(self.directory, field, chunk), mode=mode, dtype=self.dtype, shape=shape)
+            for field, shape in shapes.items()
+        }
+        self._chunks['iteration'] = np.lib.format.open_memmap(
+            chunk_path(self.directory, 'iteration', chunk), mode=mode, dtype='int64', shape=(self.chunk_size,)
+        )
+
+    def move_to(self, directory: str | os.PathLike) -> None:
+        if self.count:
+            raise ValueError("{} already holds {} records of this run".format(self.directory, self.count))
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def reopen(self, count: int) -> None:
+        # Continues an existing recording at row `count`, used when a run resumes from a checkpoint
+        metadata = json.loads((self.directory / METADATA_FILE).read_text())
+        if metadata['chunk_size'] != self.chunk_size or metadata['dtype'] != self.dtype:
+            raise ValueError("{} was recorded with a different chunk_size or dtype".format(self.directory))
+
+        self.metadata = metadata
+        self.count = count
+
+        chunk, row = divmod(count, self.chunk_size)
+        if row != 0:
+            self._open_chunk(chunk, mode='r+')
+        self.flush()
+
+    def record(self, iteration: int, swarm: 'Swarm') -> None:
+        if self.metadata is None:
+            self.metadata = {
+                'population': len(swarm.particles),
+                'dimension': swarm.dimension,
+                'chunk_size': self.chunk_size,
+                'dtype': self.dtype,
+                'count': 0,
+            }
+
+        chunk, row = divmod(self.count, self.chunk_size)
+        if row == 0:
+            self._open_chunk(chunk)
+
+        self._chunks['pos'][row] = swarm.pos
+        self._chunks['velocity'][row] = swarm.velocity
+        self._chunks['fitness_value'][row] = swarm.fitness_value
+        self._chunks['iteration'][row] = iteration
+        self.count += 1
+
+    def flush(self) -> None:
+        for chunk in self._chunks.values():
+            chunk.flush()
+
+        if self.metadata is not None:
+            self.metadata['count'] = self.count
+            write_metadata(self.directory, self.metadata)
+
+    def close(self) -> None:
+        self.flush()
+        self._chunks = {}
+
+    def __enter__(self) -> 'TrajectoryRecorder':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ChunkedArray:
+    # Lazily memory-maps only the chunks a slice touches, the first axis is the record index
+    def __init__(self, directory: Path, field: str, count: int, chunk_size: int):
+        self.directory = directory
+        self.field = field
+        self.count = count
+        self.chunk_size = chunk_size
+        self._chunks: Dict[int, np.memmap] = {}
+
+    def _chunk(self, chunk: int) -> np.memmap:
+        if chunk not in self._chunks:
+            self._chunks[chunk] = np.load(chunk_path(self.directory, self.field, chunk), mmap_mode='r')
+
+        return self._chunks[chunk]
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def shape(self) -> tuple:
+        return (self.count, *self._chunk(0).shape[1:])
+
+    def __getitem__(self, key) -> np.ndarray:
+        key = key if isinstance(key, tuple) else (key,)
+        first, rest = key[0], key[1:]
+
+        if first is Ellipsis:
+            first, rest = slice(None), (Ellipsis, *rest)
+
+        if isinstance(first, (int, np.integer)):
+            index = first + self.count if first < 0 else first
+            if not 0 <= index < self.count:
+                raise IndexError("record index {} out of range".format(first))
+
+            chunk, row = divmod(index, self.chunk_size)
+            return np.asarray(self._chunk(chunk)[(row, *rest)])
+
+        start, stop, step = first.indices(self.count)
+        if step < 0:
+            raise IndexError("negative steps are not supported")
+
+        parts: List[np.ndarray] = []
+        for chunk in range(start // self.chunk_size, (stop - 1) // self.chunk_size + 1 if stop > start else 0):
+            chunk_start = chunk * self.chunk_size
+            chunk_stop = min(chunk_start + self.chunk_size, stop)
+
+            # First index of the stepped range that falls inside this chunk
+            local_start = start if start >= chunk_start else start + -(-(chunk_start - start) // step) * step
+            if local_start >= chunk_stop:
+                continue
+
+            parts.append(self._chunk(chunk)[(slice(local_start - chunk_start, chunk_stop - chunk_start, step), *rest)])
+
+        if not parts:
+            return np.asarray(self._chunk(0)[(slice(0, 0), *rest)])
+
+        return np.concatenate(parts)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        array = self[:]
+        return array if dtype is None else array.astype(dtype)
+
+
+class Trajectory:
+    # Read side of TrajectoryRecorder, exposes the same pos / fitness_value / iterations as TrajectoryHistory
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+        self.metadata: Dict = json.loads((self.directory / METADATA_FILE).read_text())
+
+        count, chunk_size = self.metadata['count'], self.metadata['chunk_size']
+        self.pos = ChunkedArray(self.directory, 'pos', count, chunk_size)
+        self.velocity = ChunkedArray(self.directory, 'velocity', count, chunk_size)
+        self.fitness_value = ChunkedArray(self.directory, 'fitness_value', count, chunk_size)
+        self._iterations = ChunkedArray(self.directory, 'iteration', count, chunk_size)
+
+    @property
+    def count(self) -> int:
+        return self.metadata['count']
+
+    @property
+    def iterations(self) -> np.ndarray:
+        return self._iterations[:]
@@ -0,0 +1,73 @@
+import sys
+from enum import IntEnum
+from typing import TYPE_CHECKING, List, TextIO
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .engine import PSO, Swarm
+
+
+class Verbosity(IntEnum):
+    SILENT = 0      # No reporter at all, nothing runs inside the loop
+    SUMMARY = 1     # One line per iteration
+    FULL = 2        # Per-particle table per iteration
+
+
+def round_pos(value: np.ndarray, digits: int = 4) -> float | List[float]:
+    return round(float(value[0]), digits) if len(value) == 1 else np.round(value, digits).tolist()
+
+
+class Reporter:
+    def __init__(self, verbosity: Verbosity = Verbosity.SUMMARY, stream: TextIO | None = None):
+        self.verbosity = verbosity
+        self._stream = stream
+        self._header: str | None = None
+
+    @property
+    def stream(self) -> TextIO:
+        # Resolved on every write so redirect_stdout keeps working
+        return self._stream or sys.stdout
+
+    def header(self, dimension: int) -> str:
+        if self._header is None:
+            def columns(name: str) -> List[str]:
+                return [name] if dimension == 1 else ["{}_{}".format(name, dim + 1) for dim in range(dimension)]
+
+            self._header = " ".join(["particle", *columns("x"), "fitness", *columns("velocity"), *columns("p_best")])
+
+        return self._header
+
+    def iteration(self, iteration: int, swarm: 'Swarm') -> None:
+        if self.verbosity == Verbosity.SUMMARY:
+            self.stream.write(
+                "Iterasi {}: G_best: {}, best fitness: {}, mean fitness: {}\n"
+                .format(iteration, round_pos(swarm.best_pos), round(swarm.best_fitness_value, 4), round(float(swarm.fitness_value.mean()), 4))
+            )
+            return
+
+        # The whole swarm is formatted from its arrays in one batched write
+        table = np.column_stack((
+            np.arange(1, len(swarm.fitness_value) + 1),
+            swarm.pos,
+            swarm.fitness_value,
+            swarm.velocity,
+            swarm.particle_best_pos,
+        ))
+
+        self.stream.write("--- Iterasi {} ---\n".format(iteration))
+        np.savetxt(self.stream, table, fmt=['%d'] + ['%.4f'] * (table.shape[1] - 1), header=self.header(swarm.dimension), comments='')
+        self.stream.write("G_best: {}\n\n".format(round_pos(swarm.best_pos)))
+
+    def finish(self, pso: 'PSO') -> None:
+        self.stream.write("G_best: {}\n".format(round_pos(pso.swarm.best_pos)))
+        self.stream.write("Best Fitness: {}\n".format(round(pso.swarm.best_fitness_value, 4)))
+
+        if pso.stopped_by is not None:
+            self.stream.write("Stopped by {} after {} iterations, {} evaluations saved\n".format(pso.stopped_by, pso.iteration, pso.evaluations_saved))
+
+        stats = getattr(pso.fitness, 'stats', None)
+        if stats is not None:
+            self.stream.write("Evaluator -> {}\n".format(stats.summary()))
+
+        self.stream.flush()
@@ -0,0 +1,115 @@
+import argparse
+import functools
+import importlib.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List, NamedTuple
+
+import numpy as np
+
+from .engine import PSO, Seed
+
+
+class RunResult(NamedTuple):
+    index: int                  # Run i uses child i of SeedSequence(seed)
+    best_pos: np.ndarray
+    best_fitness_value: float
+    convergence: np.ndarray
+    duration: float
+
+
+class RestartSummary:
+    def __init__(self, runs: List[RunResult], duration: float):
+        self.runs: List[RunResult] = sorted(runs, key=lambda run: run.index)
+        self.duration = duration
+
+        self.best_fitness_values: np.ndarray = np.array([run.best_fitness_value for run in self.runs])
+        self.best: RunResult = self.runs[int(np.argmin(self.best_fitness_values))]
+
+    @property
+    def convergence(self) -> np.ndarray:
+        # Shape (runs, iterations + 1), runs that stopped early are padded with their final value
+        length = max(len(run.convergence) for run in self.runs)
+        return np.stack([np.pad(run.convergence, (0, length - len(run.convergence)), mode='edge') for run in self.runs])
+
+    def statistics(self) -> Dict[str, float]:
+        values = self.best_fitness_values
+        return {
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'mean': float(values.mean()),
+            'median': float(np.median(values)),
+            'std': float(values.std()),
+        }
+
+    def report(self) -> None:
+        print("--- {} restarts in {}s ---".format(len(self.runs), round(self.duration, 4)))
+        print("Best run: {}".format(self.best.index + 1))
+        print("G_best: {}".format(np.round(self.best.best_pos, 4).tolist()))
+        print("Best Fitness: {}".format(round(self.best.best_fitness_value, 4)))
+        print(", ".join("{}: {}".format(name, round(value, 4)) for name, value in self.statistics().items()))
+
+
+def run_seeded(create_pso: Callable[[Seed], PSO], index: int, seed: Seed) -> RunResult:
+    start = time.perf_counter()
+
+    pso = create_pso(seed)
+    pso.reporter = None
+    pso.separate_outputs('run_{}'.format(index))
+    pso.run()
+
+    return RunResult(index, pso.swarm.best_pos, pso.swarm.best_fitness_value, pso.convergence, time.perf_counter() - start)
+
+def run_restarts(
+        create_pso: Callable[[Seed], PSO],
+        restarts: int,
+        seed: int = 0,
+        processes: int | None = None,
+) -> RestartSummary:
+    # create_pso(seed) must be picklable (a module level function). Every restart gets its own
+    # child stream of the seed, so processes=1 reproduces a parallel run exactly.
+    processes = processes or os.cpu_count()
+    seeds = np.random.SeedSequence(seed).spawn(restarts)
+    start = time.perf_counter()
+
+    if processes == 1:
+        runs = [run_seeded(create_pso, index, child) for index, child in enumerate(seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            runs = list(executor.map(
+                functools.partial(run_seeded, create_pso),
+                range(restarts),
+                seeds,
+                chunksize=max(1, restarts // (processes * 4)),
+            ))
+
+    return RestartSummary(runs, time.perf_counter() - start)
+
+
+@functools.cache
+def load_script(path: str) -> ModuleType:
+    # Scripts such as ParticleSwarmOptimization-2Dim.py are not importable by name
+    spec = importlib.util.spec_from_file_location(Path(path).stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def create_from_script(path: str, seed: Seed) -> PSO:
+    return load_script(path).create_pso(seed)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run independently seeded PSO restarts in a process pool")
+    parser.add_argument('script', help="script defining create_pso(seed), e.g. ParticleSwarmOptimization-2Dim.py")
+    parser.add_argument('-k', '--restarts', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=None)
+    args = parser.parse_args()
+
+    path = str(Path(args.script).resolve())
+    load_script(path)   # Loaded once here so forked workers inherit it
+
+    run_restarts(functools.partial(create_from_script, path), args.restarts, args.seed, args.processes).report()
@@ -0,0 +1,69 @@
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .engine import PSO
+
+
+class StoppingCriterion:
+    name: str = 'criterion'
+
+    def start(self, pso: 'PSO') -> None:
+        pass
+
+    def should_stop(self, pso: 'PSO') -> bool:
+        raise NotImplementedError
+
+
+class NoImprovement(StoppingCriterion):
+    # G_best fitness improved by less than `tolerance` over the last `window` iterations
+    name = 'no_improvement'
+
+    def __init__(self, tolerance: float = 1e-8, window: int = 10):
+        self.tolerance = tolerance
+        self.window = window
+
+    def should_stop(self, pso: 'PSO') -> bool:
+        if pso.iteration < self.window:
+            return False
+
+        return pso.convergence[pso.iteration - self.window] - pso.convergence[pso.iteration] < self.tolerance
+
+
+class SwarmDiameter(StoppingCriterion):
+    # Diagonal of the swarm's bounding box, O(particles x dims) unlike the pairwise diameter
+    name = 'swarm_diameter'
+
+    def __init__(self, epsilon: float = 1e-6):
+        self.epsilon = epsilon
+
+    def should_stop(self, pso: 'PSO') -> bool:
+        pos = pso.swarm.pos
+        return float(np.linalg.norm(pos.max(axis=0) - pos.min(axis=0))) < self.epsilon
+
+
+class WallClock(StoppingCriterion):
+    name = 'wall_clock'
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.started_at = 0.0
+
+    def start(self, pso: 'PSO') -> None:
+        self.started_at = time.perf_counter()
+
+    def should_stop(self, pso: 'PSO') -> bool:
+        return time.perf_counter() - self.started_at >= self.seconds
+
+
+class EvaluationBudget(StoppingCriterion):
+    # Stops before an iteration would go over the budget
+    name = 'evaluation_budget'
+
+    def __init__(self, evaluations: int):
+        self.evaluations = evaluations
+
+    def should_stop(self, pso: 'PSO') -> bool:
+        return pso.evaluations + len(pso.swarm.particles) > self.evaluations
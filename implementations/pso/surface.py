@@ -0,0 +1,70 @@
+import hashlib
+import inspect
+import os
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from .engine import Bounds, as_bounds
+
+
+CACHE_DIRECTORY = Path(os.environ.get('PSO_SURFACE_CACHE', Path(__file__).resolve().parents[1] / '.surface_cache'))
+
+
+class Surface(NamedTuple):
+    x: np.ndarray       # (resolution,)
+    y: np.ndarray       # (resolution,)
+    z: np.ndarray       # (resolution, resolution) indexed [y, x] like np.meshgrid, memory-mapped from the cache
+
+
+def function_source(function: Callable) -> str:
+    try:
+        return inspect.getsource(function)
+    except (OSError, TypeError):
+        # Lambdas typed into a REPL and builtins have no source file
+        code = getattr(function, '__code__', None)
+        return repr((getattr(function, '__qualname__', repr(function)), code.co_code if code else None, code.co_consts if code else None))
+
+def surface_key(function: Callable, x_bounds: np.ndarray, y_bounds: np.ndarray, resolution: int) -> str:
+    digest = hashlib.sha256(function_source(function).encode())
+    digest.update(np.asarray([*x_bounds, *y_bounds, resolution], dtype=float).tobytes())
+    return digest.hexdigest()[:32]
+
+def evaluate_rows(function: Callable, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    Y, X = np.meshgrid(y, x, indexing='ij')
+
+    if getattr(function, 'is_batched', False):
+        return function(np.column_stack((X.ravel(), Y.ravel()))).reshape(X.shape)
+
+    # Scalar-style functions written with NumPy operations, such as f(x, y), take the grids directly
+    return function(X, Y)
+
+def fitness_surface(
+        function: Callable,
+        bounds: Bounds,
+        resolution: int = 50,
+        chunk_rows: int = 256,
+        cache_directory: str | os.PathLike = CACHE_DIRECTORY,
+) -> Surface:
+    lower_bounds, upper_bounds = as_bounds(bounds, 2)
+    x = np.linspace(lower_bounds[0], upper_bounds[0], resolution)
+    y = np.linspace(lower_bounds[1], upper_bounds[1], resolution)
+
+    cache_directory = Path(cache_directory)
+    path = cache_directory / '{}.npy'.format(surface_key(function, x[[0, -1]], y[[0, -1]], resolution))
+
+    if not path.exists():
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix('.{}.tmp'.format(os.getpid()))
+
+        # Filled chunk_rows rows at a time straight into the file, so memory stays bounded
+        z = np.lib.format.open_memmap(temporary, mode='w+', dtype='float64', shape=(resolution, resolution))
+        for start in range(0, resolution, chunk_rows):
+            z[start:start + chunk_rows] = evaluate_rows(function, x, y[start:start + chunk_rows])
+
+        z.flush()
+        del z
+        os.replace(temporary, path)
+
+    return Surface(x, y, np.load(path, mmap_mode='r'))
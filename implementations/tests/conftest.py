@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The pso package is imported the way the scripts import it, from the implementations directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,53 @@
+import functools
+from pathlib import Path
+
+import numpy as np
+
+from pso import PSO, Checkpointer, Seed, Trajectory, TrajectoryRecorder, Verbosity
+from pso.checkpoint import load_checkpoint
+from pso.islands import run_islands
+from pso.restarts import run_restarts
+
+
+MAX_ITERATIONS = 20
+
+
+def sphere(x: float, y: float) -> float:
+    return x ** 2 + y ** 2
+
+def create_pso(directory: Path, seed: Seed) -> PSO:
+    # Every run built here points at the same checkpoint file and recording directory
+    return PSO(
+        sphere,
+        [(-5, 5), (-5, 5)],
+        population=8,
+        max_iterations=MAX_ITERATIONS,
+        verbosity=Verbosity.SILENT,
+        seed=seed,
+        recorder=TrajectoryRecorder(directory / 'recording', chunk_size=8),
+        checkpointer=Checkpointer(directory / 'checkpoint.npz', interval=5),
+    )
+
+def assert_own_outputs(directory: Path, name: str, best_fitness_value: float) -> None:
+    checkpoint = load_checkpoint(directory / 'checkpoint.{}.npz'.format(name))
+    assert int(checkpoint['iteration']) == MAX_ITERATIONS
+    assert float(checkpoint['best_fitness_value']) == best_fitness_value
+
+    trajectory = Trajectory(directory / 'recording' / name)
+    np.testing.assert_array_equal(trajectory.iterations, np.arange(MAX_ITERATIONS + 1))
+    assert trajectory.fitness_value[:].min() == best_fitness_value
+
+
+def test_restarts_write_their_own_checkpoint_and_recording(tmp_path):
+    summary = run_restarts(functools.partial(create_pso, tmp_path), restarts=3, processes=3)
+
+    assert not (tmp_path / 'checkpoint.npz').exists()
+    for run in summary.runs:
+        assert_own_outputs(tmp_path, 'run_{}'.format(run.index), run.best_fitness_value)
+
+def test_islands_write_their_own_checkpoint_and_recording(tmp_path):
+    summary = run_islands(functools.partial(create_pso, tmp_path), dimension=2, islands=2, migration_interval=5)
+
+    assert not (tmp_path / 'checkpoint.npz').exists()
+    for island in summary.islands:
+        assert_own_outputs(tmp_path, 'island_{}'.format(island.island), island.best_fitness_value)
@@ -0,0 +1,177 @@
+import argparse
+import ast
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+ROOT = Path(__file__).resolve().parent
+SCENES_DIRECTORY = ROOT / 'scenes'
+CACHE_PATH = ROOT / 'media' / '.render_cache.json'
+
+QUALITIES = {
+    'l': 'low_quality',
+    'm': 'medium_quality',
+    'h': 'high_quality',
+    'p': 'production_quality',
+    'k': 'fourk_quality',
+}
+
+
+class Job(NamedTuple):
+    path: Path
+    scene: str
+    quality: str
+
+
+class Result(NamedTuple):
+    job: Job
+    status: str         # rendered, skipped or failed
+    duration: float
+    error: str | None = None
+
+
+def find_scenes(path: Path) -> List[str]:
+    # Parsed instead of imported so discovery never pays the Manim import, scenes whose
+    # __init__ needs arguments (the PSO plots take a trajectory) can only be rendered from code
+    scenes = []
+    for node in ast.parse(path.read_text()).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(getattr(base, 'id', getattr(base, 'attr', '')).endswith('Scene') for base in node.bases):
+            continue
+
+        init = next((item for item in node.body if isinstance(item, ast.FunctionDef) and item.name == '__init__'), None)
+        if init is not None and len(init.args.args) - len(init.args.defaults) > 1:
+            continue
+
+        scenes.append(node.name)
+    return scenes
+
+def local_sources(path: Path, seen: set | None = None) -> List[Path]:
+    # The scene file plus every module it imports from scenes/, so editing a shared helper invalidates its users
+    seen = set() if seen is None else seen
+    seen.add(path)
+
+    for node in ast.walk(ast.parse(path.read_text())):
+        names = [alias.name for alias in node.names] if isinstance(node, ast.Import) else [node.module] if isinstance(node, ast.ImportFrom) and node.module else []
+        for name in names:
+            dependency = SCENES_DIRECTORY / '{}.py'.format(name.split('.')[0])
+            if dependency.exists() and dependency not in seen:
+                local_sources(dependency, seen)
+
+    return sorted(seen)
+
+def config_hash(path: Path, quality: str) -> str:
+    digest = hashlib.sha256()
+    for source in local_sources(path):
+        digest.update(source.read_bytes())
+    digest.update(quality.encode())
+    digest.update(importlib.metadata.version('manim').encode())
+
+    configuration = ROOT / 'manim.cfg'
+    if configuration.exists():
+        digest.update(configuration.read_bytes())
+    return digest.hexdigest()
+
+def job_key(job: Job) -> str:
+    return '{}::{}::{}'.format(job.path.relative_to(ROOT).as_posix(), job.scene, job.quality)
+
+def load_cache() -> Dict[str, str]:
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def write_cache(cache: Dict[str, str]) -> None:
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    temporary = CACHE_PATH.with_name(CACHE_PATH.name + '.tmp')
+    temporary.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    os.replace(temporary, CACHE_PATH)
+
+def render(job: Job) -> Result:
+    # Runs in a pool worker, Manim and each scene module are imported once per worker and reused
+    start = time.perf_counter()
+    try:
+        from manim import tempconfig
+
+        if str(SCENES_DIRECTORY) not in sys.path:
+            sys.path.insert(0, str(SCENES_DIRECTORY))
+
+        module = sys.modules.get(job.path.stem)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(job.path.stem, job.path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[job.path.stem] = module
+            spec.loader.exec_module(module)
+
+        with tempconfig({'quality': job.quality, 'media_dir': str(ROOT / 'media')}):
+            getattr(module, job.scene)().render()
+    except Exception as error:
+        return Result(job, 'failed', time.perf_counter() - start, repr(error))
+
+    return Result(job, 'rendered', time.perf_counter() - start)
+
+def render_all(jobs: List[Job], processes: int | None = None, force: bool = False) -> Tuple[List[Result], float]:
+    start = time.perf_counter()
+    cache = load_cache()
+    hashes = {job: config_hash(job.path, job.quality) for job in jobs}
+
+    results = [Result(job, 'skipped', 0.0) for job in jobs if not force and cache.get(job_key(job)) == hashes[job]]
+    pending = [job for job in jobs if force or cache.get(job_key(job)) != hashes[job]]
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for future in as_completed([executor.submit(render, job) for job in pending]):
+                result = future.result()
+                results.append(result)
+
+                # Recorded as each render succeeds, an interrupted batch keeps its finished scenes
+                if result.status == 'rendered':
+                    cache[job_key(result.job)] = hashes[result.job]
+                    write_cache(cache)
+
+    return results, time.perf_counter() - start
+
+def summary(results: List[Result], wall_time: float) -> str:
+    lines = ['{:<40} {:<20} {:<9} {:>9}'.format('scene', 'quality', 'status', 'seconds')]
+    for result in sorted(results, key=lambda result: job_key(result.job)):
+        lines.append('{:<40} {:<20} {:<9} {:>9.2f}'.format(
+            '{}.{}'.format(result.job.path.stem, result.job.scene), result.job.quality, result.status, result.duration,
+        ))
+        if result.error:
+            lines.append('    ' + result.error)
+
+    counts = {status: sum(result.status == status for result in results) for status in ('rendered', 'skipped', 'failed')}
+    lines.append(
+        '{rendered} rendered, {skipped} skipped, {failed} failed'.format(**counts)
+        + ' in {:.2f}s wall, {:.2f}s render time'.format(wall_time, sum(result.duration for result in results))
+    )
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Render every Scene in scenes/ that changed since its last successful render")
+    parser.add_argument('--qualities', nargs='+', default=['h'], choices=list(QUALITIES))
+    parser.add_argument('--scenes', nargs='+', help="only render these scene class names")
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help="ignore the render cache")
+    args = parser.parse_args()
+
+    jobs = [
+        Job(path, scene, QUALITIES[quality])
+        for path in sorted(SCENES_DIRECTORY.glob('*.py'))
+        for scene in find_scenes(path)
+        if args.scenes is None or scene in args.scenes
+        for quality in args.qualities
+    ]
+
+    results, wall_time = render_all(jobs, args.processes, args.force)
+    print(summary(results, wall_time))
+    sys.exit(any(result.status == 'failed' for result in results))
@@ -1,11 +1,111 @@
+import numpy as np
 from manim import *
 
 
+# `trajectory` is anything exposing `iterations`, `pos` and `fitness_value` record arrays,
+# e.g. `pso.swarm.history` or a memory-mapped `Trajectory` written by `TrajectoryRecorder`
+
+
+FITNESS_LIMIT = 50
+READ_ROWS = 4096     # records read from the trajectory at a time when downsampling
+
+
+def trajectory_paths(plane: CoordinateSystem, iterations: np.ndarray, values: np.ndarray, **kwargs) -> VMobject:
+    # Every particle's polyline as one subpath of a single VMobject, values has shape (records, particles)
+    # and iterations is either shared (records,) or per particle (records, particles) after downsampling
+    records, particles = values.shape
+    iterations = np.asarray(iterations)
+    if iterations.ndim == 1:
+        iterations = iterations[:, None]
+
+    corners = plane.coords_to_point(
+        np.column_stack((np.broadcast_to(iterations, values.shape).ravel(), values.ravel()))
+    ).reshape(records, particles, 3).transpose(1, 0, 2)
+
+    # Straight cubic segments: both handles sit on the line between consecutive corners
+    start, end = corners[:, :-1], corners[:, 1:]
+    segments = np.stack((start, start + (end - start) / 3, start + 2 * (end - start) / 3, end), axis=2)
+
+    paths = VMobject(**kwargs)
+    paths.set_points(segments.reshape(-1, 3))
+    return paths
+
+
+def pixel_columns(plane: CoordinateSystem) -> int:
+    return max(1, int(config.pixel_width * plane.x_axis.width / config.frame_width))
+
+def bucket_starts(records: int, count: int) -> np.ndarray:
+    # First record of each of `count` buckets spread evenly over the records, none of them empty
+    return np.unique(np.linspace(0, records, count + 1).astype(int)[:-1])
+
+def bucket_blocks(starts: np.ndarray, records: int, rows: int = READ_ROWS):
+    # (first bucket, end bucket, first record, end record) of consecutive whole buckets covering about
+    # `rows` records each, so a memory-mapped trajectory is only read a block at a time
+    ends = np.append(starts[1:], records)
+    first = 0
+    while first < len(starts):
+        end = first + max(1, int(np.searchsorted(ends[first:], starts[first] + rows, side='right')))
+        end = min(end, len(starts))
+        yield first, end, int(starts[first]), int(ends[end - 1])
+        first = end
+
+def downsample_min_max(iterations: np.ndarray, values, budget: int, limit: float = np.inf) -> tuple[np.ndarray, np.ndarray]:
+    # Keeps the lowest and highest record of every bucket in time order, so spikes survive at any length.
+    # values is any (records, particles) array that can be sliced by record, values are clipped to `limit`
+    iterations = np.asarray(iterations)
+    records = len(values)
+    if records <= budget:
+        return iterations, np.minimum(values[:], limit)
+
+    starts = bucket_starts(records, max(1, budget // 2))
+    xs, ys = [], []
+    for first, end, start, stop in bucket_blocks(starts, records):
+        block = np.minimum(values[start:stop], limit)
+        local = starts[first:end] - start
+        bucket = np.repeat(np.arange(end - first), np.diff(np.append(local, len(block))))
+        rows = np.arange(len(block))[:, None]
+
+        low, high = np.minimum.reduceat(block, local), np.maximum.reduceat(block, local)
+        lowAt = np.minimum.reduceat(np.where(block == low[bucket], rows, len(block)), local)
+        highAt = np.minimum.reduceat(np.where(block == high[bucket], rows, len(block)), local)
+
+        lowFirst = lowAt <= highAt
+        xs.append(np.stack((np.where(lowFirst, lowAt, highAt), np.where(lowFirst, highAt, lowAt)), axis=1) + start)
+        ys.append(np.stack((np.where(lowFirst, low, high), np.where(lowFirst, high, low)), axis=1))
+
+    indices = np.concatenate(xs).reshape(-1, xs[0].shape[-1])
+    return iterations[indices], np.concatenate(ys).reshape(indices.shape)
+
+def aggregate_band(iterations: np.ndarray, values, budget: int, limit: float = np.inf) -> tuple[np.ndarray, np.ndarray]:
+    # Min, median and max across the swarm, (records, 3), reduced to at most `budget` records
+    iterations = np.asarray(iterations, dtype=float)
+    records = len(values)
+    if records <= budget:
+        values = np.minimum(values[:], limit)
+        return iterations, np.column_stack((values.min(axis=1), np.median(values, axis=1), values.max(axis=1)))
+
+    starts = bucket_starts(records, budget)
+    xs, bands = [], []
+    for first, end, start, stop in bucket_blocks(starts, records):
+        block = np.minimum(values[start:stop], limit)
+        local = starts[first:end] - start
+        sizes = np.diff(np.append(local, len(block)))
+
+        xs.append(np.add.reduceat(iterations[start:stop], local) / sizes)
+        bands.append(np.column_stack((
+            np.minimum.reduceat(block.min(axis=1), local),
+            [np.median(part) for part in np.split(np.median(block, axis=1), local[1:])],
+            np.maximum.reduceat(block.max(axis=1), local),
+        )))
+
+    return np.concatenate(xs), np.concatenate(bands)
+
+
 class PSOPosPlot(Scene):
-    def __init__(self, pso, max_iterations, BOUNDS):
+    def __init__(self, trajectory, max_iterations, BOUNDS):
         super().__init__()
 
-        self.pso = pso
+        self.trajectory = trajectory
         self.max_iterations = max_iterations
         self.bounds = BOUNDS
 
@@ -31,27 +131,29 @@ class PSOPosPlot(Scene):
 
         self.add(plane, x_label, y_label)
 
-        for particle in self.pso.swarm.particles:
-            line_graph = plane.plot_line_graph(
-                x_values=range(self.max_iterations + 1),
-                y_values=particle.pos_history,
-                line_color=GOLD_E,
-                add_vertex_dots=False,
-                stroke_width=4,
-            )
-            self.add(line_graph)
+        self.add(trajectory_paths(
+            plane,
+            self.trajectory.iterations,
+            self.trajectory.pos[..., 0],
+            stroke_color=GOLD_E,
+            stroke_width=4,
+        ))
 
 class PSOFitnessPlot(Scene):
-    def __init__(self, pso, max_iterations):
+    # aggregate=True draws the swarm's min/max band and median line instead of one line per particle,
+    # vertex_budget defaults to two vertices per pixel column of the x axis
+    def __init__(self, trajectory, max_iterations, aggregate=False, vertex_budget=None):
         super().__init__()
 
-        self.pso = pso
+        self.trajectory = trajectory
         self.max_iterations = max_iterations
+        self.aggregate = aggregate
+        self.vertex_budget = vertex_budget
 
     def construct(self):
         plane = NumberPlane(
             x_range=(0, self.max_iterations),
-            y_range=(0, 50, 5),
+            y_range=(0, FITNESS_LIMIT, 5),
             x_length=10,
             y_length=5,
             axis_config={"include_numbers": True},
@@ -70,13 +172,87 @@ class PSOFitnessPlot(Scene):
 
         self.add(plane, x_label, y_label)
 
-        for particle in self.pso.swarm.particles:
-            line_graph = plane.plot_line_graph(
-                x_values=range(self.max_iterations + 1),
-                y_values=list(map(lambda v: 50 if v >= 50 else v, particle.fitness_value_history)),
-                line_color=random_color(),
-                add_vertex_dots=False,
-                stroke_width=4,
-            )
+        budget = self.vertex_budget or 2 * pixel_columns(plane)
+        values = self.trajectory.fitness_value
+
+        if not self.aggregate:
+            iterations, values = downsample_min_max(self.trajectory.iterations, values, budget, FITNESS_LIMIT)
+            self.add(trajectory_paths(plane, iterations, values, stroke_color=BLUE, stroke_width=4))
+            return
+
+        iterations, band = aggregate_band(self.trajectory.iterations, values, budget, FITNESS_LIMIT)
+        lower = plane.coords_to_point(np.column_stack((iterations, band[:, 0])))
+        upper = plane.coords_to_point(np.column_stack((iterations, band[:, 2])))
 
-            self.add(line_graph)
+        area = VMobject(stroke_width=0, fill_color=BLUE, fill_opacity=0.3)
+        area.set_points_as_corners(np.concatenate((lower, upper[::-1], lower[:1])))
+
+        self.add(area, trajectory_paths(plane, iterations, band[:, 1:2], stroke_color=BLUE, stroke_width=4))
+
+
+def surface_image(surface, colors=(BLUE_E, TEAL, GREEN, YELLOW)) -> ImageMobject:
+    # Colours the (rows, columns) z grid in one pass, image row 0 is the top so y is flipped
+    z = np.asarray(surface.z)[::-1]
+    scaled = (z - z.min()) / max(np.ptp(z), np.finfo(float).eps) * (len(colors) - 1)
+    palette = np.array([color_to_rgb(color) for color in colors])
+
+    stops = np.arange(len(colors))
+    rgb = np.stack([np.interp(scaled, stops, palette[:, channel]) for channel in range(3)], axis=-1)
+    alpha = np.ones((*z.shape, 1))
+    return ImageMobject((np.concatenate((rgb, alpha), axis=-1) * 255).astype(np.uint8))
+
+
+class PSOSwarmAnimation(Scene):
+    # positions is an (iterations, particles, 2) array such as `trajectory.pos`, surface a `fitness_surface` result
+    def __init__(self, positions, BOUNDS, surface=None, seconds_per_iteration=1, dot_radius=DEFAULT_DOT_RADIUS):
+        super().__init__()
+
+        self.positions = np.asarray(positions, dtype=float)
+        self.bounds = BOUNDS
+        self.surface = surface
+        self.seconds_per_iteration = seconds_per_iteration
+        self.dot_radius = dot_radius
+
+    def construct(self):
+        plane = NumberPlane(
+            x_range=self.bounds,
+            y_range=self.bounds,
+            x_length=6,
+            y_length=6,
+            axis_config={"include_numbers": True},
+            background_line_style={"stroke_opacity": 0.3},
+        )
+        plane.center()
+
+        if self.surface is not None:
+            contour = surface_image(self.surface)
+            contour.stretch_to_fit_width(plane.x_axis.width)
+            contour.stretch_to_fit_height(plane.y_axis.height)
+            contour.move_to(plane.c2p(np.mean(self.surface.x[[0, -1]]), np.mean(self.surface.y[[0, -1]])))
+            self.add(contour)
+
+        self.add(plane)
+
+        # All dots are subpaths of one VMobject, a frame is one gather, one lerp and one set_points
+        template = Dot(ORIGIN, radius=self.dot_radius).points
+        positions = self.positions
+        last = len(positions) - 1
+        time = ValueTracker(0)
+
+        def place(dots: VMobject) -> None:
+            index = min(int(time.get_value()), max(last - 1, 0))
+            fraction = min(time.get_value() - index, 1)
+            centres = positions[index] + (positions[min(index + 1, last)] - positions[index]) * fraction
+            dots.set_points((plane.coords_to_point(centres)[:, None] + template).reshape(-1, 3))
+
+        dots = VMobject(stroke_width=0, fill_color=RED, fill_opacity=1)
+        place(dots)
+        dots.add_updater(place)
+        self.add(dots)
+
+        self.play(
+            time.animate.set_value(last),
+            run_time=max(last, 1) * self.seconds_per_iteration,
+            rate_func=linear,
+        )
+        dots.clear_updaters()
@@ -0,0 +1,166 @@
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Tuple
+
+
+SEARCH_PSEUDOCODE = '''
+def search(node, key):
+    if node is None or node.key == key:
+        return node
+        
+    if node.key < key:
+        return search(node.right, key)
+        
+    return search(node.left, key)
+        '''
+
+INORDER_PSEUDOCODE = '''
+def printInorder(node):
+    if node is None:
+        return
+        
+    printInorder(node.left)
+    print(node.value)
+    printInorder(node.right)
+    
+    return
+        '''
+
+# Line indices into the pseudocode above, as laid out by `Code`
+SEARCH_DEFINITION, SEARCH_BASE_CASE, SEARCH_FOUND, SEARCH_COMPARE, SEARCH_RIGHT, SEARCH_LEFT = 0, 1, 2, 4, 5, 7
+INORDER_DEFINITION, INORDER_BASE_CASE, INORDER_NIL, INORDER_LEFT, INORDER_PRINT, INORDER_RIGHT, INORDER_RETURN = 0, 1, 2, 4, 5, 6, 8
+
+# Event kinds
+VISIT = 'visit'         # a call starts on `node`
+LINE = 'line'           # the current call executes `line`
+RETURN = 'return'       # a child call returned, control is back on `node` at `line`
+PRINT = 'print'         # `node` is written to the output
+
+LEFT_CHILD, RIGHT_CHILD = 0, 1
+
+
+class Event(NamedTuple):
+    kind: str
+    node: Hashable | None = None    # vertex id, a key or the name of a nil leaf
+    line: int | None = None
+
+
+class Node:
+    __slots__ = ('key', 'children')
+
+    def __init__(self, key: Hashable):
+        self.key = key
+        self.children: List['Node | None'] = [None, None]
+
+    @property
+    def left(self) -> 'Node | None':
+        return self.children[LEFT_CHILD]
+
+    @property
+    def right(self) -> 'Node | None':
+        return self.children[RIGHT_CHILD]
+
+
+class BinarySearchTree:
+    # Every walk is iterative, so degenerate trees with thousands of keys stay within the recursion limit
+    def __init__(self, keys: Iterable[Hashable] = ()):
+        self.root: Node | None = None
+        self.size = 0
+
+        for key in keys:
+            self.insert(key)
+
+    def insert(self, key: Hashable) -> Node:
+        parent, side, node = None, LEFT_CHILD, self.root
+        while node is not None:
+            if key == node.key:
+                return node
+            parent, side = node, RIGHT_CHILD if node.key < key else LEFT_CHILD
+            node = node.children[side]
+
+        node = Node(key)
+        if parent is None:
+            self.root = node
+        else:
+            parent.children[side] = node
+
+        self.size += 1
+        return node
+
+    def slots(self) -> Iterable[Tuple[Node | None, int, Node | None]]:
+        # (parent, side, child) for every child slot including the empty ones, in order
+        stack: List[Tuple[Node | None, int, Node | None, bool]] = [(None, LEFT_CHILD, self.root, False)]
+        while stack:
+            parent, side, node, expanded = stack.pop()
+            if node is None or expanded:
+                yield parent, side, node
+                continue
+
+            stack.append((node, RIGHT_CHILD, node.right, False))
+            stack.append((parent, side, node, True))
+            stack.append((node, LEFT_CHILD, node.left, False))
+
+    def nil_ids(self) -> Dict[Tuple[Hashable | None, int], str]:
+        # Empty child slots named T1, T2, ... left to right, keyed by (parent key, side)
+        nils = [(parent.key if parent else None, side) for parent, side, node in self.slots() if node is None]
+        return {slot: 'T{}'.format(index) for index, slot in enumerate(nils, 1)}
+
+    def vertices(self) -> List[Hashable]:
+        return [node.key for _, _, node in self.slots() if node is not None]
+
+    def edges(self) -> List[Tuple[Hashable, Hashable]]:
+        return [(parent.key, node.key) for parent, _, node in self.slots() if parent is not None and node is not None]
+
+    def search_trace(self, key: Hashable) -> List[Event]:
+        # `return search(...)` hands the result straight back, so the unwinding calls emit nothing
+        nil_ids = self.nil_ids()
+        trace = []
+        parent, side, node = None, LEFT_CHILD, self.root
+
+        while True:
+            trace.append(Event(VISIT, node.key if node else nil_ids[(parent.key if parent else None, side)], SEARCH_DEFINITION))
+            trace.append(Event(LINE, line=SEARCH_BASE_CASE))
+
+            if node is None or node.key == key:
+                trace.append(Event(LINE, line=SEARCH_FOUND))
+                if node is not None:
+                    trace.append(Event(PRINT, node.key))
+                return trace
+
+            trace.append(Event(LINE, line=SEARCH_COMPARE))
+            side = RIGHT_CHILD if node.key < key else LEFT_CHILD
+            trace.append(Event(LINE, line=SEARCH_RIGHT if side == RIGHT_CHILD else SEARCH_LEFT))
+            parent, node = node, node.children[side]
+
+    def inorder_trace(self) -> List[Event]:
+        nil_ids = self.nil_ids()
+        trace = []
+
+        # Explicit call stack: ('call', parent, side) enters a child, ('resume', node, side) continues after it
+        stack: List[Tuple[str, Node | None, int]] = [('call', None, LEFT_CHILD)]
+        while stack:
+            action, node, side = stack.pop()
+
+            if action == 'resume' and side == LEFT_CHILD:
+                trace.append(Event(RETURN, node.key, INORDER_PRINT))
+                trace.append(Event(PRINT, node.key))
+                trace.append(Event(LINE, line=INORDER_RIGHT))
+                stack.append(('resume', node, RIGHT_CHILD))
+                stack.append(('call', node, RIGHT_CHILD))
+                continue
+
+            if action == 'resume':
+                trace.append(Event(RETURN, node.key, INORDER_RETURN))
+                continue
+
+            child = node.children[side] if node else self.root
+            trace.append(Event(VISIT, child.key if child else nil_ids[(node.key if node else None, side)], INORDER_DEFINITION))
+            trace.append(Event(LINE, line=INORDER_BASE_CASE))
+
+            if child is None:
+                trace.append(Event(LINE, line=INORDER_NIL))
+                continue
+
+            trace.append(Event(LINE, line=INORDER_LEFT))
+            stack.append(('resume', child, LEFT_CHILD))
+            stack.append(('call', child, LEFT_CHILD))
+
+        return trace
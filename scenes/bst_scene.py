@@ -0,0 +1,76 @@
+from typing import Hashable, Iterable, Tuple
+
+from manim import *
+
+from bst import LINE, PRINT, RETURN, VISIT, BinarySearchTree, Event
+from timeline import Timeline
+from tree_layout import TreeLayout
+
+
+class BinarySearchTreeTrace:
+    # Mixed into a Scene that sets `graph`, `highlighter` and `output`, turns an event trace from `BinarySearchTree`
+    # into animations in one pass over the trace
+    graph = None
+    layout = None
+    highlighter = None
+    output = None
+
+    def getGraph(self, tree: BinarySearchTree, nils: bool | Iterable[Tuple[Hashable | None, int]] = False) -> Graph:
+        # nils is handed to TreeLayout: True draws every empty slot, otherwise only the given (parent key, side) slots
+        self.layout = TreeLayout(tree, nils)
+
+        positions = self.layout.positions
+        span = np.ptp(positions, axis=0) if len(positions) else np.zeros(2)
+        scale = min(1.2, 6 / max(span[0], 1), 5 / max(span[1], 1))
+        self.layoutPoints = np.column_stack((positions * scale, np.zeros(len(positions))))
+        self.vertexRadius = 0.4 * scale
+
+        vertex_config = {"radius": self.vertexRadius}
+        vertex_config.update({nil: {"radius": self.vertexRadius, "fill_color": GRAY} for nil in self.layout.nilVertices})
+
+        return Graph(
+            self.layout.vertices,
+            self.layout.edges,
+            layout=dict(zip(self.layout.vertices, self.layoutPoints)),
+            labels=True,
+            vertex_config=vertex_config,
+        )
+
+    def arrowEnds(self, vertex: Hashable) -> Tuple[np.ndarray, np.ndarray]:
+        # The graph has only been moved since it was laid out, so the root anchors every layout point
+        shift = self.graph.vertices[self.layout.vertices[0]].get_center() - self.layoutPoints[0]
+        end = self.layoutPoints[self.layout.index[vertex]] + shift + LEFT * self.vertexRadius
+        return end + LEFT + UP * 0.5, end
+
+    def playTrace(self, trace: List[Event]) -> None:
+        # The graph and code are already in place, so every animation below can be built ahead of time
+        with Timeline(self):
+            for index, event in enumerate(trace):
+                following = trace[index + 1] if index + 1 < len(trace) else None
+
+                if event.kind in (VISIT, RETURN):
+                    start, end = self.arrowEnds(event.node)
+                    if self.arrow is None:
+                        self.arrow = Arrow(start=start, end=end, color=YELLOW)
+                        arrowAnimation = Write(self.arrow)
+                    else:
+                        arrowAnimation = self.arrow.animate.put_start_and_end_on(start, end)
+
+                    self.play(self.highlighter.move(event.line), arrowAnimation)
+                    self.wait()
+
+                elif event.kind == LINE:
+                    self.play(self.highlighter.move(event.line))
+
+                    if following is None or following.kind != LINE:
+                        self.wait()
+
+                elif event.kind == PRINT:
+                    self.printNode(str(event.node))
+
+            if self.arrow is not None:
+                self.play(Unwrite(self.arrow))
+                self.wait()
+
+    def printNode(self, value: str) -> None:
+        self.play(*self.output.append(value))
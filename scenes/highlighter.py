@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from typing import List, Tuple
+
+from manim import *
+from manim.mobject.text.text_mobject import remove_invisible_chars
+
+
+HIGHLIGHT_OPACITY = 0.3
+SLOT_CACHE_SIZE = 32            # listings whose line slots are kept, least recently used are dropped first
+HIGHLIGHT_BUFF = SMALL_BUFF     # padding above and below a line, as SurroundingRectangle adds it
+CODE_STYLE_ATTRIBUTES = (
+    'code_string', 'language', 'style', 'line_spacing', 'font', 'font_size', 'tab_width', 'margin', 'insert_line_no',
+    'background', 'indentation_chars',
+)
+
+
+def measureLines(code: Code) -> np.ndarray:
+    # (lines, 2) centre offset and glyph height of every line, as fractions of the background height
+    # so they hold however the code is scaled or moved afterwards. The fixed padding is left out here
+    # and added at the size the code has when a line is highlighted.
+    background = code.background_mobject
+    lines: List[Mobject] = list(remove_invisible_chars(code.code.copy()))
+
+    slots = np.full((len(lines), 2), np.nan)
+    for index, line in enumerate(lines):
+        if len(line.get_all_points()):
+            slots[index] = line.get_center()[1] - background.get_center()[1], line.height
+
+    # Blank lines have no glyphs to measure, they take the place between their neighbours
+    measured = np.flatnonzero(~np.isnan(slots[:, 0]))
+    for column in range(2):
+        slots[:, column] = np.interp(np.arange(len(lines)), measured, slots[measured, column])
+
+    return slots / background.height
+
+
+class CodeHighlighter:
+    # Line slots of recently used listings are kept per (code text, style) and shared across scenes,
+    # a step then moves one rectangle instead of fading a rectangle per line in and out
+    slots: OrderedDict[Tuple, np.ndarray] = OrderedDict()
+
+    def __init__(self, code: Code, color: ManimColor = YELLOW):
+        self.code = code
+
+        key = tuple(getattr(code, attribute, None) for attribute in CODE_STYLE_ATTRIBUTES)
+        if key in self.slots:
+            self.slots.move_to_end(key)
+        else:
+            self.slots[key] = measureLines(code)
+            if len(self.slots) > SLOT_CACHE_SIZE:
+                self.slots.popitem(last=False)
+        self.lineSlots = self.slots[key]
+
+        center, height = self.slot(0)
+        self.rectangle = (
+            Rectangle(width=code.background_mobject.width, height=height, color=color)
+            .set_fill(color)
+            .set_opacity(0)
+            .move_to(center)
+        )
+
+    def slot(self, line: int) -> Tuple[np.ndarray, float]:
+        background = self.code.background_mobject
+        offset, height = self.lineSlots[line] * background.height
+        return background.get_center() + UP * offset, height + 2 * HIGHLIGHT_BUFF
+
+    def move(self, line: int) -> Animation:
+        center, height = self.slot(line)
+        return self.rectangle.animate.set_opacity(HIGHLIGHT_OPACITY).stretch_to_fit_height(height).move_to(center)
@@ -0,0 +1,69 @@
+from collections import OrderedDict, deque
+from typing import Deque, List, Tuple
+
+from manim import *
+
+
+TEXT_CACHE_SIZE = 256   # shaped Text kept per process, least recently used are dropped first
+
+
+class OutputLine:
+    # The printed values along the bottom edge, owned by one scene. Recently printed (string, style) pairs
+    # keep their shaped Text and are copied after that, and when the line fills up the oldest entries scroll
+    # out in one batch, so a print costs the same whether it is the first or the thousandth.
+    textCache: OrderedDict[Tuple[str, Tuple], Text] = OrderedDict()
+
+    def __init__(self, buff: float = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER, **style):
+        self.buff = buff
+        self.style = style
+        self.styleKey = tuple(sorted((name, str(value)) for name, value in style.items()))
+
+        self.entries: Deque[Text] = deque()
+        self.left = -config.frame_width / 2 + DEFAULT_MOBJECT_TO_EDGE_BUFFER
+        self.maxWidth = config.frame_width - 2 * DEFAULT_MOBJECT_TO_EDGE_BUFFER
+        self.cursor = self.left
+        self.rowY: float | None = None
+
+    def text(self, value: str) -> Text:
+        key = (value, self.styleKey)
+        if key in self.textCache:
+            self.textCache.move_to_end(key)
+        else:
+            self.textCache[key] = Text(value, **self.style)
+            if len(self.textCache) > TEXT_CACHE_SIZE:
+                self.textCache.popitem(last=False)
+        return self.textCache[key].copy()
+
+    def append(self, value: str) -> List[Animation]:
+        # Positions come from the running cursor rather than the mobjects, so the animations can be
+        # built while earlier ones are still queued on a Timeline
+        text = self.text(value)
+        if self.rowY is None:
+            self.rowY = -config.frame_height / 2 + DEFAULT_MOBJECT_TO_EDGE_BUFFER + text.height / 2
+
+        animations = []
+        if self.entries and self.cursor + text.width > self.left + self.maxWidth:
+            animations = self.reflow(text.width)
+
+        text.move_to([self.cursor + text.width / 2, self.rowY, 0])
+        self.entries.append(text)
+        self.cursor += text.width + self.buff
+
+        return animations + [Write(text)]
+
+    def reflow(self, incoming: float) -> List[Animation]:
+        # Drops the oldest entries until the line is at most half full and slides the rest back to the left
+        dropped = []
+        while self.entries and self.cursor - self.left + incoming > self.maxWidth / 2:
+            text = self.entries.popleft()
+            self.cursor -= text.width + self.buff
+            dropped.append(text)
+
+        animations = [FadeOut(*dropped)] if dropped else []
+        x = self.left
+        for text in self.entries:
+            animations.append(text.animate.move_to([x + text.width / 2, self.rowY, 0]))
+            x += text.width + self.buff
+        self.cursor = x
+
+        return animations
@@ -0,0 +1,62 @@
+from typing import Any, Dict, List, Tuple
+
+from manim import *
+from manim.animation.animation import prepare_animation
+
+
+class Timeline:
+    # Inside `with Timeline(scene):` the scene's play and wait calls are queued instead of rendered.
+    # Consecutive plays are flushed as one Succession and adjacent waits as one wait, so a run of
+    # steps becomes a single partial movie file instead of one per call.
+    #
+    # Animations are built when play is called, before the queued ones have run. `.animate` keeps its
+    # target on the mobject itself, so a later builder would otherwise overwrite an earlier queued one.
+    # Code inside the block must not read positions that a queued animation is about to change.
+    def __init__(self, scene: Scene):
+        self.scene = scene
+        self.steps: List[Tuple[Tuple[Animation, ...], Dict[str, Any]]] = []
+        self.pendingWait = 0.0
+
+    def play(self, *animations, **kwargs) -> None:
+        if self.pendingWait:
+            self.flushWait()
+        self.steps.append((tuple(prepare_animation(animation) for animation in animations), kwargs))
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, **kwargs) -> None:
+        if kwargs:
+            # stop_condition, frozen_frame and friends change how the wait renders, keep it separate
+            self.flush()
+            self._wait(duration, **kwargs)
+            return
+
+        self.flushSteps()
+        self.pendingWait += duration
+
+    def flushSteps(self) -> None:
+        if not self.steps:
+            return
+
+        groups = [AnimationGroup(*animations, **kwargs) for animations, kwargs in self.steps]
+        self.steps = []
+        self._play(groups[0] if len(groups) == 1 else Succession(*groups))
+
+    def flushWait(self) -> None:
+        if self.pendingWait:
+            self._wait(self.pendingWait)
+            self.pendingWait = 0.0
+
+    def flush(self) -> None:
+        self.flushSteps()
+        self.flushWait()
+
+    def __enter__(self) -> 'Timeline':
+        self._play, self._wait = self.scene.play, self.scene.wait
+        self.scene.play, self.scene.wait = self.play, self.wait
+        return self
+
+    def __exit__(self, *exception) -> None:
+        try:
+            if exception[0] is None:
+                self.flush()
+        finally:
+            del self.scene.play, self.scene.wait
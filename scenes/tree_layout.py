@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Set, Tuple
+
+import numpy as np
+
+from bst import LEFT_CHILD, RIGHT_CHILD, BinarySearchTree, Node
+
+
+SEPARATION = 1.0    # minimum horizontal distance between two vertices on the same level
+EMPTY = 0           # shape id of a missing subtree
+POSITION_CACHE_SIZE = 16    # root shapes whose positions are kept, least recently used are dropped first
+
+# A contour is a linked list of (delta, next) cells, one per level, holding the x of the leftmost or
+# rightmost vertex on that level as a delta from the level above, relative to the subtree root.
+# Deltas make contours persistent: a parent reuses its deeper child's tail without copying or shifting it.
+Contour = Tuple[float, 'Contour'] | None
+
+
+class Shape(NamedTuple):
+    offset: float       # children sit at -offset and +offset from this root
+    left: Contour
+    right: Contour
+    height: int
+
+
+def extend(contour: Contour, shift: float) -> Contour:
+    # The child's contour seen from its parent, one level deeper and shifted by the child's offset
+    return 0.0, (contour[0] + shift, contour[1])
+
+def splice(prefix: Contour, prefixShift: float, tail: Contour, tailShift: float, levels: int) -> Contour:
+    # The first `levels` levels of `prefix` followed by `tail` from that level on, both seen from their
+    # parent. Only the shorter side is copied, which keeps a whole layout O(n) like Reingold–Tilford's threads.
+    deltas = []
+    x = prefixShift
+    for _ in range(levels):
+        deltas.append(prefix[0])
+        x += prefix[0]
+        prefix = prefix[1]
+
+    tailX = tailShift
+    for _ in range(levels + 1):
+        tailX += tail[0]
+        tail = tail[1]
+
+    contour = (tailX - x, tail)
+    for delta in reversed(deltas[1:]):
+        contour = (delta, contour)
+    return 0.0, (deltas[0] + prefixShift, contour)
+
+
+class TreeLayout:
+    # Reingold–Tilford layout of a BinarySearchTree, root at (0, 0) and one unit per level downwards.
+    # Subtree shapes are interned and their contours kept, so a layout only merges shapes it has never
+    # seen and an insert only revisits the path from the new key up to the root. The tables belong to
+    # the layout and go away with its scene.
+    def __init__(self, tree: BinarySearchTree, nils: bool | Iterable[Tuple[Hashable | None, int]] = False):
+        # nils=True draws every empty child slot, otherwise only the given (parent key, side) slots
+        self.tree = tree
+        self.nils: bool | Set[Tuple[Hashable | None, int]] = nils if isinstance(nils, bool) else set(nils)
+        self.shapeOf: Dict[Hashable, int] = {}
+
+        self.shapeIds: Dict[Tuple[int, int], int] = {}
+        self.shapes: List[Shape | None] = [None]
+        self.positionCache: OrderedDict[int, np.ndarray] = OrderedDict()
+
+        for node in self.postorder():
+            self.shapeOf[node.key] = self.nodeShape(node)
+
+        self.update()
+
+    def postorder(self) -> Iterable[Node]:
+        stack = [(self.tree.root, False)] if self.tree.root else []
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                yield node
+                continue
+
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.children) if child is not None)
+
+    def drawsNil(self, slot: Tuple[Hashable | None, int]) -> bool:
+        return self.nils if isinstance(self.nils, bool) else slot in self.nils
+
+    def childShape(self, node: Node, side: int) -> int:
+        child = node.children[side]
+        if child is not None:
+            return self.shapeOf[child.key]
+        return self.shapeId(EMPTY, EMPTY) if self.drawsNil((node.key, side)) else EMPTY
+
+    def nodeShape(self, node: Node) -> int:
+        return self.shapeId(self.childShape(node, LEFT_CHILD), self.childShape(node, RIGHT_CHILD))
+
+    def shapeId(self, left: int, right: int) -> int:
+        key = (left, right)
+        if key not in self.shapeIds:
+            self.shapeIds[key] = len(self.shapes)
+            self.shapes.append(self.merge(self.shapes[left], self.shapes[right]))
+        return self.shapeIds[key]
+
+    @staticmethod
+    def merge(left: Shape | None, right: Shape | None) -> Shape:
+        if left is None and right is None:
+            return Shape(0.0, (0.0, None), (0.0, None), 1)
+
+        if left is None or right is None:
+            child, shift = (left, -SEPARATION / 2) if right is None else (right, SEPARATION / 2)
+            return Shape(SEPARATION / 2, extend(child.left, shift), extend(child.right, shift), child.height + 1)
+
+        # Push the subtrees apart until the right contour of the left one clears the left contour of the right one
+        levels = min(left.height, right.height)
+        gap, leftX, rightX = 0.0, 0.0, 0.0
+        leftContour, rightContour = left.right, right.left
+        for _ in range(levels):
+            leftX += leftContour[0]
+            rightX += rightContour[0]
+            gap = max(gap, leftX - rightX)
+            leftContour, rightContour = leftContour[1], rightContour[1]
+
+        offset = (gap + SEPARATION) / 2
+
+        if left.height >= right.height:
+            leftOutline = extend(left.left, -offset)
+        else:
+            leftOutline = splice(left.left, -offset, right.left, offset, left.height)
+
+        if right.height >= left.height:
+            rightOutline = extend(right.right, offset)
+        else:
+            rightOutline = splice(right.right, offset, left.right, -offset, right.height)
+
+        return Shape(offset, leftOutline, rightOutline, max(left.height, right.height) + 1)
+
+    def insert(self, key: Hashable) -> None:
+        path = []
+        node = self.tree.root
+        while node is not None:
+            if key == node.key:
+                return
+            path.append(node)
+            node = node.children[RIGHT_CHILD if node.key < key else LEFT_CHILD]
+
+        path.append(self.tree.insert(key))
+        for node in reversed(path):
+            self.shapeOf[node.key] = self.nodeShape(node)
+
+        self.update()
+
+    def update(self) -> None:
+        # One preorder pass names the vertices, the positions only depend on the root shape and are cached by it
+        nilIds = self.tree.nil_ids()
+        root = self.tree.root
+
+        self.vertices: List[Hashable] = []
+        self.edges: List[Tuple[Hashable, Hashable]] = []
+        self.nilVertices: Set[str] = set()
+        x: List[float] = []
+        y: List[float] = []
+
+        if root is None:
+            if self.drawsNil((None, LEFT_CHILD)):
+                self.vertices.append(nilIds[(None, LEFT_CHILD)])
+                self.nilVertices.add(self.vertices[0])
+                x.append(0.0)
+                y.append(0.0)
+            self.setPositions(None, x, y)
+            return
+
+        rootShape = self.shapeOf[root.key]
+        cached = self.positionCache.get(rootShape)
+        if cached is not None:
+            self.positionCache.move_to_end(rootShape)
+
+        stack: List[Tuple[Node | None, Hashable, Hashable | None, float, int]] = [(root, root.key, None, 0.0, 0)]
+        while stack:
+            node, vertex, parent, position, depth = stack.pop()
+            self.vertices.append(vertex)
+            if parent is not None:
+                self.edges.append((parent, vertex))
+            if cached is None:
+                x.append(position)
+                y.append(-depth)
+
+            if node is None:
+                self.nilVertices.add(vertex)
+                continue
+
+            offset = self.shapes[self.shapeOf[node.key]].offset
+            for side, shift in ((RIGHT_CHILD, offset), (LEFT_CHILD, -offset)):
+                child = node.children[side]
+                if child is not None:
+                    stack.append((child, child.key, vertex, position + shift, depth + 1))
+                elif self.drawsNil((node.key, side)):
+                    stack.append((None, nilIds[(node.key, side)], vertex, position + shift, depth + 1))
+
+        self.setPositions(rootShape, x, y, cached)
+
+    def setPositions(self, rootShape: int | None, x: List[float], y: List[float], cached: np.ndarray | None = None) -> None:
+        if cached is None:
+            cached = np.column_stack((x, y)) if x else np.zeros((0, 2))
+            if rootShape is not None:
+                self.positionCache[rootShape] = cached
+                if len(self.positionCache) > POSITION_CACHE_SIZE:
+                    self.positionCache.popitem(last=False)
+
+        self.positions = cached
+        self.index = {vertex: index for index, vertex in enumerate(self.vertices)}
+
+    def position(self, vertex: Hashable) -> np.ndarray:
+        return self.positions[self.index[vertex]]